@@ -0,0 +1,87 @@
+"""Queue model benchmark: insert, reorder and update 10,000 queue entries in a live view.
+
+Run from the project root:  python benchmarks/bench_queue_model.py [items]
+Uses Qt's offscreen platform when no display is set.
+"""
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication, QListView
+from gui.queue_ui import QueueModel, QueueItemDelegate
+from gui.scheduler import QueueEntry, ItemState
+
+
+def timed(label, func, app):
+    start = time.perf_counter()
+    func()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    print(f"{label:38s} {elapsed * 1000:9.1f} ms")
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = QApplication(sys.argv)
+    random.seed(1)
+
+    model = QueueModel()
+    view = QListView()
+    view.setModel(model)
+    view.setItemDelegate(QueueItemDelegate(view))
+    view.setUniformItemSizes(True)
+    view.resize(380, 700)
+    view.show()
+    app.processEvents()
+
+    entries = [QueueEntry(f"https://www.youtube.com/watch?v={i:011d}") for i in range(items)]
+    timed(f"insert {items} (one batch)", lambda: model.add_entries(entries), app)
+
+    single = QueueModel()
+    view.setModel(single)
+    timed(f"insert {items} (one at a time)", lambda: [single.add_entries([e]) for e in entries], app)
+    view.setModel(model)
+    app.processEvents()
+
+    def adjacent_moves():
+        for _ in range(items):
+            row = random.randrange(items - 1)
+            model.move_row(row, row + 1)
+    timed(f"reorder {items} (adjacent moves)", adjacent_moves, app)
+
+    def long_moves():
+        for _ in range(1000):
+            model.move_row(random.randrange(items), random.randrange(items))
+    timed("reorder 1000 (random distance)", long_moves, app)
+
+    def progress_burst():
+        for entry in entries[:50]:
+            entry.set_state(ItemState.ANALYZING)
+            entry.set_state(ItemState.READY)
+            entry.set_state(ItemState.DOWNLOADING, progress=0)
+        for step in range(200):
+            for entry in entries[:50]:
+                entry.progress = step / 2
+                model.mark_changed(entry)
+        model.flush()
+    timed("10000 progress updates (coalesced)", progress_burst, app)
+
+    timed("repaint visible rows", lambda: view.viewport().repaint(), app)
+    timed("scroll to bottom and repaint", lambda: (view.scrollToBottom(), view.viewport().repaint()), app)
+
+    rows_ok = all(model.row_of(entry) == row for row, entry in enumerate(model.entries))
+    print(f"row index consistent: {rows_ok}")
+    # Skip interpreter teardown: some PySide6 builds abort while collecting Qt wrappers at exit,
+    # which would turn a passing run into rc 134
+    sys.stdout.flush()
+    os._exit(0 if rows_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
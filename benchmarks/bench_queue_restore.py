@@ -0,0 +1,100 @@
+"""Queue store benchmark: save a 5,000 item queue, then restore it into a live view.
+
+Run from the project root:  python benchmarks/bench_queue_restore.py [items]
+Analysis results are synthetic but sized like real ones (about 20 formats per
+video, every tenth item a 200 video playlist). Uses Qt's offscreen platform
+when no display is set.
+"""
+import os
+import sys
+import time
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication, QListView
+from core.queue_store import QueueStore, compact_info
+from gui.queue_ui import QueueModel, QueueItemDelegate
+from gui.scheduler import QueueEntry, ItemState
+
+STREAM_URL = 'https://rr1---sn-example.googlevideo.com/videoplayback?' + 'x' * 900
+
+
+def fake_video(i):
+    return {
+        'id': f'vid{i:08d}', 'title': f'Video {i}', 'webpage_url': f'https://www.youtube.com/watch?v=vid{i:08d}',
+        'uploader': 'Channel', 'uploader_id': '@channel', 'duration': 300 + i % 600,
+        'description': 'Description line. ' * 100,
+        'thumbnails': [{'url': f'https://i.ytimg.com/vi/vid{i:08d}/{q}.jpg'} for q in ('default', 'hqdefault', 'maxresdefault')],
+        'formats': [{
+            'format_id': str(100 + f), 'ext': 'mp4', 'height': 144 * (1 + f % 8), 'fps': 30,
+            'vcodec': 'avc1.64001F', 'acodec': 'none' if f % 3 else 'mp4a.40.2', 'tbr': 500.0 + f,
+            'filesize': 10_000_000 + f, 'protocol': 'https', 'url': STREAM_URL,
+            'http_headers': {'User-Agent': 'Mozilla/5.0 ' * 10},
+        } for f in range(20)],
+    }
+
+
+def fake_playlist(i):
+    return {
+        '_type': 'playlist', 'id': f'PL{i:08d}', 'title': f'Playlist {i}',
+        'entries': [{'id': f'e{i:05d}{n:04d}', 'title': f'Entry {n}', 'url': f'https://www.youtube.com/watch?v=e{i:05d}{n:04d}',
+                     'duration': 200 + n, 'thumbnails': [{'url': f'https://i.ytimg.com/vi/e{i:05d}{n:04d}/hq.jpg'}]}
+                    for n in range(200)],
+    }
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    app = QApplication(sys.argv)
+    states = (ItemState.READY, ItemState.DONE, ItemState.FAILED, ItemState.DOWNLOADING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = QueueStore(os.path.join(tmp, 'queue.sqlite'))
+        records = []
+        for i in range(items):
+            playlist = i % 10 == 0
+            info = fake_playlist(i) if playlist else fake_video(i)
+            entry = QueueEntry(info.get('webpage_url') or f'https://www.youtube.com/playlist?list=PL{i:08d}')
+            entry.store_id = entry.position = i + 1
+            entry.title, entry.url_type, entry.state = info['title'], 'playlist' if playlist else 'video', states[i % 4]
+            record = entry.to_record()
+            record['info'] = compact_info(info)
+            records.append(record)
+
+        start = time.perf_counter()
+        store.save(records)
+        print(f"save {items} items (one transaction)      {(time.perf_counter() - start) * 1000:9.1f} ms")
+        print(f"store size                              {os.path.getsize(store.path) / 1024 ** 2:9.1f} MiB")
+        store.close()
+
+        model = QueueModel()
+        view = QListView()
+        view.setModel(model)
+        view.setItemDelegate(QueueItemDelegate(view))
+        view.setUniformItemSizes(True)
+        view.resize(380, 700)
+        view.show()
+        app.processEvents()
+
+        start = time.perf_counter()
+        restored = QueueStore(os.path.join(tmp, 'queue.sqlite'))
+        loaded = restored.load()
+        loaded_at = time.perf_counter()
+        entries = [QueueEntry.from_record(record) for record in loaded]
+        model.add_entries(entries)
+        app.processEvents()
+        elapsed = time.perf_counter() - start
+        print(f"load queue rows                         {(loaded_at - start) * 1000:9.1f} ms")
+        print(f"restore {len(entries)} items into the view        {elapsed * 1000:9.1f} ms  "
+              f"({'under' if elapsed < 1 else 'OVER'} 1 s budget)")
+        resumed = sum(1 for entry in entries if entry.state == ItemState.READY)
+        print(f"ready to download without extraction    {resumed:9d} items")
+        restored.close()
+
+
+if __name__ == "__main__":
+    main()
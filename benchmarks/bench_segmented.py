@@ -0,0 +1,93 @@
+"""Benchmark: single-connection vs. ranged multi-connection download against a throttled local server.
+
+Run from the project root:  python benchmarks/bench_segmented.py [size_mib] [per_connection_kib_s]
+The server caps every connection separately, like a CDN's per-connection
+throttle, so parallel ranges should scale until the link is saturated.
+No network access is needed.
+"""
+import os
+import sys
+import time
+import hashlib
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.segmented import SegmentedDownloader
+
+BLOCK = 16 * 1024
+
+
+def make_handler(payload, per_connection_rate):
+    class ThrottledHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            start, end, status = 0, len(payload) - 1, 200
+            header = self.headers.get('Range')
+            if header and header.startswith('bytes='):
+                first, _, last = header[6:].partition('-')
+                start, end, status = int(first), min(int(last or end), end), 206
+            self.send_response(status)
+            self.send_header('Content-Length', str(end - start + 1))
+            self.send_header('Accept-Ranges', 'bytes')
+            if status == 206:
+                self.send_header('Content-Range', f'bytes {start}-{end}/{len(payload)}')
+            self.end_headers()
+            began = time.monotonic()
+            sent = 0
+            try:
+                while start <= end:
+                    block = payload[start:min(start + BLOCK, end + 1)]
+                    self.wfile.write(block)
+                    start += len(block)
+                    sent += len(block)
+                    ahead = sent / per_connection_rate - (time.monotonic() - began)
+                    if ahead > 0:
+                        time.sleep(ahead)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return ThrottledHandler
+
+
+def timed_download(url, path, connections, total):
+    downloader = SegmentedDownloader(connections)
+    start = time.perf_counter()
+    downloader.download(url, path, total=total)
+    elapsed = time.perf_counter() - start
+    downloader.close()
+    return elapsed
+
+
+def main():
+    size = int(float(sys.argv[1]) * 1024 ** 2) if len(sys.argv) > 1 else 16 * 1024 ** 2
+    rate = int(float(sys.argv[2]) * 1024) if len(sys.argv) > 2 else 4096 * 1024
+    payload = os.urandom(size)
+    digest = hashlib.sha256(payload).hexdigest()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(payload, rate))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/video.mp4'
+
+    print(f"file {size / 1024 ** 2:.1f} MiB, server cap {rate / 1024 ** 2:.1f} MiB/s per connection")
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = None
+        for connections in (1, 2, 4, 8):
+            path = os.path.join(tmp, f'video_{connections}.mp4')
+            elapsed = timed_download(url, path, connections, None)
+            with open(path, 'rb') as f:
+                ok = hashlib.sha256(f.read()).hexdigest() == digest
+            baseline = baseline or elapsed
+            print(f"{connections} connection(s): {elapsed:6.2f} s  {size / elapsed / 1024 ** 2:7.1f} MiB/s  "
+                  f"{baseline / elapsed:4.1f}x  {'verified' if ok else 'CORRUPT'}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
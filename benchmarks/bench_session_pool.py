@@ -0,0 +1,54 @@
+"""Micro-benchmark: per-call YoutubeDL setup cost, fresh instance vs. pooled session.
+
+Run from the project root:  python benchmarks/bench_session_pool.py [iterations]
+No network access is needed; only instance setup and extractor lookup are timed.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yt_dlp
+from core.session import YDLSessionPool
+
+OPTS = {'quiet': True, 'no_warnings': True, 'format': 'bestaudio/best'}
+
+
+def per_call(ydl):
+    # Touch the extractor registry the way extract_info does for a YouTube URL
+    ydl.get_info_extractor('Youtube')
+
+
+def bench_fresh(iterations):
+    start = time.perf_counter()
+    for i in range(iterations):
+        with yt_dlp.YoutubeDL({**OPTS, 'outtmpl': f'bench_{i}.%(ext)s'}) as ydl:
+            per_call(ydl)
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_pooled(iterations):
+    pool = YDLSessionPool()
+    with pool.session(OPTS) as ydl:
+        per_call(ydl)  # warm-up, mirrors the first call of a running app
+    start = time.perf_counter()
+    for i in range(iterations):
+        with pool.session({**OPTS, 'outtmpl': f'bench_{i}.%(ext)s'}) as ydl:
+            per_call(ydl)
+    elapsed = (time.perf_counter() - start) / iterations
+    pool.close()
+    return elapsed
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    fresh = bench_fresh(iterations)
+    pooled = bench_pooled(iterations)
+    print(f"fresh YoutubeDL per call : {fresh * 1000:8.3f} ms")
+    print(f"pooled session per call  : {pooled * 1000:8.3f} ms")
+    print(f"overhead removed per call: {(fresh - pooled) * 1000:8.3f} ms ({fresh / max(pooled, 1e-9):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Cold-start benchmark: GUI import time and time to first paint, checked against a budget.
+
+Run from the project root:  python benchmarks/bench_startup.py [runs]
+Each run is a fresh interpreter in an empty working and data directory, so the
+developer's settings and persisted queue are never read or resumed. Uses Qt's
+offscreen platform when no display is set.
+Exits non-zero if the median exceeds benchmarks/startup_budget.json, or if
+yt_dlp was loaded before the first frame.
+"""
+import os
+import sys
+import json
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_budget.json')
+
+PROBE = r"""
+import sys, time, json
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtCore import QObject, QEvent, QTimer
+from core.utils import check_ffmpeg
+check_ffmpeg()
+from gui import MediaDownloaderGUI
+imported = time.perf_counter()
+
+QMessageBox.warning = lambda *args, **kwargs: None  # missing-ffmpeg dialog would block
+app = QApplication(sys.argv)
+result = {'import_seconds': imported - start}
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and 'first_paint_seconds' not in result:
+            result['first_paint_seconds'] = time.perf_counter() - start
+            result['yt_dlp_loaded'] = 'yt_dlp' in sys.modules
+            QTimer.singleShot(0, app.quit)
+        return False
+
+window = MediaDownloaderGUI()
+paint_filter = FirstPaint()
+app.installEventFilter(paint_filter)
+window.show()
+QTimer.singleShot(5000, app.quit)
+app.exec()
+print(json.dumps(result))
+"""
+
+
+def run_once():
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOT, env.get('PYTHONPATH')]))
+    with tempfile.TemporaryDirectory() as tmp:
+        env['YTD_DATA_DIR'] = os.path.join(tmp, 'data')
+        out = subprocess.run([sys.executable, '-c', PROBE], cwd=tmp, env=env,
+                             capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with open(BUDGET_FILE, 'r') as f:
+        budget = json.load(f)
+    results = [run_once() for _ in range(runs)]
+    failed = False
+    for metric, limit in budget.items():
+        values = [r[metric] for r in results if metric in r]
+        median = statistics.median(values) if values else float('inf')
+        status = 'ok' if median <= limit else 'OVER BUDGET'
+        failed |= median > limit
+        print(f"{metric:22s} median {median * 1000:7.1f} ms  budget {limit * 1000:7.1f} ms  {status}")
+    if any(r.get('yt_dlp_loaded') for r in results):
+        print("yt_dlp was imported before the first frame")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
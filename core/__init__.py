@@ -1,6 +1,17 @@
-from .utils import sanitize_filename, detect_url_type, check_ffmpeg, get_ffmpeg_path, get_script_dir
+from .utils import (sanitize_filename, detect_url_type, classify_url, check_ffmpeg, get_ffmpeg_path,
+                    get_script_dir, get_extractor_call_count)
 from .downloader import VideoDownloader
-from .playlist import PlaylistExtractor
+from .playlist import PlaylistExtractor, MAX_REDIRECTS
+from .cache import MetadataCache
+from .session import YDLSessionPool, default_pool
+from .planner import FormatPlan, plan_formats
+from .journal import JobJournal
+from .archive import DownloadArchive
+from .strategy import StrategyMemory
+from .sync import PlaylistSync
+from .bandwidth import BandwidthGovernor, default_governor, parse_rate
+from .segmented import SegmentedDownloader, SegmentedDownloadError
+from .queue_store import QueueStore, compact_info
 
 class YouTubeDownloaderCore:
     def __init__(self):
@@ -8,6 +19,7 @@ class YouTubeDownloaderCore:
         self.audio_formats = ['MP3', 'M4A', 'WAV']
         self._downloader = VideoDownloader()
         self._playlist = PlaylistExtractor()
+        self._sync = PlaylistSync(self._playlist)
     
     def check_executable_paths(self):
         return self._downloader.check_executable_paths()
@@ -21,20 +33,102 @@ class YouTubeDownloaderCore:
     def detect_url_type(self, url):
         return detect_url_type(url)
     
-    def get_video_info(self, url):
-        return self._downloader.get_video_info(url)
+    def get_video_info(self, url, use_cache=True):
+        return self._downloader.get_video_info(url, use_cache)
+
+    def get_cache_stats(self):
+        return self._downloader.metadata_cache.stats()
+
+    def get_session_stats(self):
+        return default_pool.stats()
+
+    def get_strategy_stats(self):
+        """Per URL class success rate and latency of each playlist extraction strategy."""
+        return self._playlist.strategy_memory.stats()
+
+    def set_strategy_race(self, count):
+        """Run the `count` best-ranked playlist strategies in parallel (1 = one at a time)."""
+        self._playlist.race = max(1, int(count))
     
+    def analyze(self, url, limit=None, _redirects=0):
+        """Classify and extract a URL, reusing the first extraction wherever possible.
+
+        Returns (info, url_type, extractor_calls); info is None if analysis failed.
+        At most MAX_REDIRECTS url results are followed, so a redirect loop fails cleanly.
+        """
+        start = get_extractor_call_count()
+        url_type = classify_url(url)
+        info = None
+        if url_type in ('playlist', 'channel'):
+            url_type = 'playlist'
+            info = self._playlist.get_playlist_info(url, limit)
+        elif url_type == 'video':
+            info = self._downloader.get_video_info(url)
+        else:
+            partial = self._downloader.extract_partial_info(url)
+            if partial and partial.get('_type') in ('url', 'url_transparent') and partial.get('url'):
+                if _redirects >= MAX_REDIRECTS:
+                    return None, 'unknown', get_extractor_call_count() - start
+                info, url_type, _ = self.analyze(partial['url'], limit, _redirects + 1)
+                return info, url_type, get_extractor_call_count() - start
+            if partial and (partial.get('_type') == 'playlist' or 'entries' in partial):
+                url_type = 'playlist'
+                info = self._playlist.playlist_from_partial(partial, limit) or self._playlist.get_playlist_info(url, limit)
+            elif partial:
+                url_type = 'video'
+                info = self._downloader.process_partial_info(partial)
+            else:
+                url_type = 'unknown'
+        return info, url_type, get_extractor_call_count() - start
+
     def get_quality_options(self, info):
         return self._downloader.get_quality_options(info)
     
-    def download_single_video(self, url, selected_format, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None):
-        return self._downloader.download_single_video(url, selected_format, target_format, title, download_dir, progress_hooks, channel, channel_id)
+    def plan_download(self, url, selected_format, target_format, info=None):
+        return self._downloader.plan_download(url, selected_format, target_format, info)
+
+    def download_single_video(self, url, selected_format, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None, info=None, weight=1.0, force=False):
+        return self._downloader.download_single_video(url, selected_format, target_format, title, download_dir, progress_hooks, channel, channel_id, info, weight, force)
     
-    def download_single_audio(self, url, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None):
-        return self._downloader.download_single_audio(url, target_format, title, download_dir, progress_hooks, channel, channel_id)
+    def download_single_audio(self, url, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None, info=None, weight=1.0, force=False):
+        return self._downloader.download_single_audio(url, target_format, title, download_dir, progress_hooks, channel, channel_id, info, weight, force)
+
+    def set_bandwidth_limit(self, bytes_per_sec):
+        """Cap the combined speed of all downloads (0 = unlimited); applies to running downloads too."""
+        self._downloader.governor.set_limit(bytes_per_sec)
+
+    def get_bandwidth_stats(self):
+        return self._downloader.governor.stats()
+
+    def set_segment_connections(self, connections):
+        """HTTP connections per progressive download; 1 leaves fetching to yt-dlp."""
+        self._downloader.set_segment_connections(connections)
     
+    def collect_garbage(self, download_dir):
+        """Remove abandoned partial downloads from a download directory's cache."""
+        return self._downloader.get_journal(download_dir).collect_garbage()
+
+    def import_archive(self, folder, checksum=False):
+        """Index existing downloads under folder so they are never fetched again."""
+        return self._downloader.archive.import_folder(folder, checksum)
+
+    def is_downloaded(self, video_id, kind='video'):
+        return self._downloader.archive.lookup(video_id, kind) is not None
+
     def get_playlist_info(self, url, limit=None):
         return self._playlist.get_playlist_info(url, limit)
+
+    def stream_playlist(self, url, limit=None):
+        """Yield (playlist_info, entries) pages as a playlist or channel is enumerated."""
+        return self._playlist.iter_playlist_pages(url, limit)
+
+    def sync_playlist(self, url, limit=None):
+        """Return (key, playlist_info) with only the entries not seen by earlier syncs."""
+        return self._sync.fetch_new(url, limit)
+
+    def mark_synced(self, key, video_ids):
+        """Record entries of a synced playlist as handled so later syncs skip them."""
+        self._sync.mark_seen(key, video_ids)
     
     def construct_video_url(self, entry):
         return self._playlist.construct_video_url(entry)
@@ -0,0 +1,183 @@
+import os
+import re
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from .utils import get_data_dir
+
+MEDIA_EXTENSIONS = ('.mp4', '.mkv', '.webm', '.mp3', '.m4a', '.wav', '.flac', '.opus')
+AUDIO_EXTENSIONS = ('.mp3', '.m4a', '.wav', '.flac', '.opus')
+ID_IN_FILENAME = re.compile(r'\[([0-9A-Za-z_-]{11})\]')
+CHECKSUM_SAMPLE = 1024 * 1024
+
+
+def quick_checksum(path):
+    """SHA-1 over the file size and its first and last MiB; cheap enough for multi-GB files."""
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(str(size).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(CHECKSUM_SAMPLE))
+        if size > CHECKSUM_SAMPLE:
+            f.seek(max(CHECKSUM_SAMPLE, size - CHECKSUM_SAMPLE))
+            digest.update(f.read(CHECKSUM_SAMPLE))
+    return digest.hexdigest()
+
+
+class DownloadArchive:
+    """Index of finished downloads: (video ID, kind) -> path, format, size, checksum.
+
+    kind is 'video' or 'audio', so a video counts as downloaded whatever container
+    or filename it was saved under. The whole index is mirrored in memory, so
+    lookups stay constant-time however long the queue is; SQLite keeps it on disk.
+    An entry whose recorded file has been deleted is stale and is dropped on
+    lookup; entries without a path (imported archive text files) cannot be checked.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_data_dir(), 'archive.sqlite')
+        self._lock = threading.Lock()
+        self._conn = None
+        self._records = None
+        self._by_path = None
+
+    def _load(self):
+        if self._records is not None:
+            return
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive (
+                video_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                path TEXT,
+                format TEXT,
+                size INTEGER,
+                checksum TEXT,
+                added REAL NOT NULL,
+                PRIMARY KEY (video_id, kind)
+            )
+        """)
+        self._conn.commit()
+        self._records = {}
+        self._by_path = {}
+        for video_id, kind, path, fmt, size, checksum in self._conn.execute(
+                "SELECT video_id, kind, path, format, size, checksum FROM archive"):
+            self._index((video_id, kind), {'path': path, 'format': fmt, 'size': size, 'checksum': checksum})
+
+    def _index(self, key, record):
+        self._records[key] = record
+        if record['path']:
+            self._by_path[os.path.normcase(os.path.abspath(record['path']))] = key
+
+    def lookup(self, video_id, kind='video'):
+        with self._lock:
+            self._load()
+            record = self._records.get((video_id, kind))
+            if record and record['path'] and not os.path.exists(record['path']):
+                self._drop_locked(video_id, [kind])
+                return None
+            return dict(record, video_id=video_id, kind=kind) if record else None
+
+    def owner_of(self, path):
+        """(video_id, kind) recorded for a file path, or None if the file is not archived."""
+        with self._lock:
+            self._load()
+            return self._by_path.get(os.path.normcase(os.path.abspath(path)))
+
+    def add(self, video_id, kind, path, fmt=None, checksum=True):
+        self.add_many([(video_id, kind, path, fmt)], checksum)
+
+    def add_many(self, items, checksum=True):
+        """Record (video_id, kind, path, format) tuples in one transaction."""
+        rows = []
+        now = time.time()
+        for video_id, kind, path, fmt in items:
+            size = digest = None
+            if path and os.path.exists(path):
+                path = os.path.abspath(path)
+                size = os.path.getsize(path)
+                digest = quick_checksum(path) if checksum else None
+            fmt = fmt or (os.path.splitext(path)[1].lstrip('.').lower() if path else None)
+            rows.append((video_id, kind, path, fmt, size, digest, now))
+        with self._lock:
+            self._load()
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO archive VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self._conn.commit()
+            except Exception:
+                return 0
+            for video_id, kind, path, fmt, size, digest, _ in rows:
+                self._index((video_id, kind), {'path': path, 'format': fmt, 'size': size, 'checksum': digest})
+        return len(rows)
+
+    def forget(self, video_id, kind=None):
+        with self._lock:
+            self._load()
+            self._drop_locked(video_id, [kind] if kind else ['video', 'audio'])
+
+    def _drop_locked(self, video_id, kinds):
+        for k in kinds:
+            record = self._records.pop((video_id, k), None)
+            if record and record['path']:
+                self._by_path.pop(os.path.normcase(os.path.abspath(record['path'])), None)
+        try:
+            self._conn.executemany("DELETE FROM archive WHERE video_id = ? AND kind = ?", [(video_id, k) for k in kinds])
+            self._conn.commit()
+        except Exception:
+            pass
+
+    def import_folder(self, folder, checksum=False):
+        """Bulk-import existing downloads under folder.
+
+        Recognises media files with a [video_id] tag in their name, yt-dlp
+        .info.json sidecars, and yt-dlp --download-archive text files.
+        """
+        items = []
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            media = {os.path.splitext(f)[0]: f for f in files if f.lower().endswith(MEDIA_EXTENSIONS)}
+            for name in files:
+                path = os.path.join(root, name)
+                lower = name.lower()
+                if lower.endswith(MEDIA_EXTENSIONS):
+                    match = ID_IN_FILENAME.search(name)
+                    if match:
+                        items.append((match.group(1), self._kind_of(name), path, None))
+                elif lower.endswith('.info.json'):
+                    media_file = media.get(name[:-len('.info.json')])
+                    video_id = self._read_info_id(path)
+                    if video_id and media_file:
+                        items.append((video_id, self._kind_of(media_file), os.path.join(root, media_file), None))
+                elif lower.endswith('.txt') and 'archive' in lower:
+                    items.extend((video_id, 'video', None, None) for video_id in self._read_archive_file(path))
+        # Entries with a known file win over bare IDs from archive text files
+        items.sort(key=lambda item: item[2] is not None)
+        return self.add_many(items, checksum)
+
+    def _kind_of(self, filename):
+        return 'audio' if filename.lower().endswith(AUDIO_EXTENSIONS) else 'video'
+
+    def _read_info_id(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('id')
+        except Exception:
+            return None
+
+    def _read_archive_file(self, path):
+        ids = []
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[0].lower() == 'youtube':
+                        ids.append(parts[1])
+        except Exception:
+            pass
+        return ids
+
+    def __len__(self):
+        with self._lock:
+            self._load()
+            return len(self._records)
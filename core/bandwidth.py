@@ -0,0 +1,114 @@
+import re
+import time
+import threading
+
+BURST_SECONDS = 1.0     # A job may run this far ahead of its rate before it is slowed down
+MAX_SLEEP = 0.25        # Sleep in short steps so limit changes apply to jobs already waiting
+ACTIVE_WINDOW = 2.0     # Jobs that moved no data for this long give up their share
+RATE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_rate(text):
+    """Parse '500K', '2.5M', '1G' or plain bytes into bytes per second; 0 or '' means unlimited."""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?)(?:i?B)?(?:/s)?\s*', str(text or '0'), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid rate: {text!r}")
+    return int(float(match.group(1)) * RATE_UNITS[match.group(2).upper()])
+
+
+class JobThrottle:
+    """One download's share of the governor; hook() is a yt-dlp progress hook."""
+
+    def __init__(self, governor, weight):
+        self.governor = governor
+        self.weight = weight
+        self.tokens = 0.0
+        self.last_refill = time.monotonic()
+        self.last_active = 0.0
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def hook(self, d):
+        if d.get('status') != 'downloading':
+            return
+        downloaded = d.get('downloaded_bytes') or 0
+        key = d.get('tmpfilename') or d.get('filename')
+        with self._lock:
+            delta = downloaded - self._seen.get(key, downloaded)
+            self._seen[key] = downloaded
+        if delta > 0:
+            self.governor.consume(self, delta)
+
+
+class BandwidthGovernor:
+    """Process-wide download rate limit shared by all jobs.
+
+    Every job gets a token bucket refilled at limit * weight / (sum of weights
+    of jobs that are currently moving data), so the total stays under the
+    limit while idle jobs leave their share to the others. yt-dlp calls the
+    progress hook in the downloading thread after every block, so a hook that
+    sleeps while the job is over budget throttles that download directly.
+    The limit and weights can be changed while downloads are running.
+    """
+
+    def __init__(self, limit=0):
+        self.limit = limit      # bytes per second, 0 = unlimited
+        self.jobs = set()
+        self._lock = threading.Lock()
+
+    def set_limit(self, limit):
+        with self._lock:
+            self.limit = max(0, int(limit or 0))
+
+    def register(self, weight=1.0):
+        throttle = JobThrottle(self, max(0.01, float(weight)))
+        with self._lock:
+            self.jobs.add(throttle)
+        return throttle
+
+    def unregister(self, throttle):
+        with self._lock:
+            self.jobs.discard(throttle)
+
+    def set_weight(self, throttle, weight):
+        with self._lock:
+            throttle.weight = max(0.01, float(weight))
+
+    def _rate_locked(self, throttle, now):
+        if not self.limit:
+            return None
+        active = [job for job in self.jobs if job is throttle or now - job.last_active < ACTIVE_WINDOW]
+        total = sum(job.weight for job in active) or throttle.weight
+        return self.limit * throttle.weight / total
+
+    def consume(self, throttle, nbytes):
+        """Charge nbytes to a job, sleeping until its bucket is back in credit."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                throttle.last_active = now
+                rate = self._rate_locked(throttle, now)
+                if rate is None:
+                    throttle.tokens = 0.0
+                    throttle.last_refill = now
+                    return
+                throttle.tokens = min(throttle.tokens + (now - throttle.last_refill) * rate, rate * BURST_SECONDS)
+                throttle.last_refill = now
+                throttle.tokens -= nbytes
+                nbytes = 0
+                if throttle.tokens >= 0:
+                    return
+                wait = -throttle.tokens / rate
+            time.sleep(min(wait, MAX_SLEEP))
+
+    def stats(self):
+        with self._lock:
+            now = time.monotonic()
+            return {
+                'limit': self.limit,
+                'jobs': len(self.jobs),
+                'active_jobs': sum(1 for job in self.jobs if now - job.last_active < ACTIVE_WINDOW),
+            }
+
+
+default_governor = BandwidthGovernor()
@@ -0,0 +1,142 @@
+import os
+import re
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from urllib.parse import urlparse, parse_qs
+from .utils import get_data_dir
+
+DEFAULT_TTL = 6 * 60 * 60          # Metadata older than this is re-extracted
+EXPIRY_MARGIN = 10 * 60            # Stop serving entries this long before stream URLs expire
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(extractor, video_id):
+    """Canonical cache key for an extracted item, e.g. 'youtube:dQw4w9WgXcQ'."""
+    return f"{(extractor or 'generic').lower()}:{video_id}"
+
+
+def get_stream_expiry(info):
+    """Earliest expiry timestamp of the signed stream URLs in info, or None if unsigned."""
+    expiry = None
+    for f in info.get('formats') or []:
+        url = f.get('url') or ''
+        value = parse_qs(urlparse(url).query).get('expire', [None])[0]
+        if value is None:
+            match = re.search(r'/expire/(\d+)', url)
+            value = match.group(1) if match else None
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            continue
+        if expiry is None or value < expiry:
+            expiry = value
+    return expiry
+
+
+class MetadataCache:
+    """On-disk cache of extracted video info, keyed by canonical video ID.
+
+    Entries expire after ``ttl`` seconds or shortly before their signed stream
+    URLs do, whichever comes first. The least recently used entries are evicted
+    once the stored payload exceeds ``max_bytes``.
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_bytes=MAX_CACHE_BYTES):
+        self.path = path or os.path.join(get_data_dir(), 'metadata.sqlite')
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_access ON metadata(last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute("SELECT data, expires_at FROM metadata WHERE key = ?", (key,)).fetchone()
+                if row is None or row[1] <= now:
+                    if row is not None:
+                        conn.execute("DELETE FROM metadata WHERE key = ?", (key,))
+                        conn.commit()
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE metadata SET last_access = ? WHERE key = ?", (now, key))
+                conn.commit()
+                self.hits += 1
+                return json.loads(zlib.decompress(row[0]))
+            except Exception:
+                self.misses += 1
+                return None
+
+    def put(self, key, info):
+        now = time.time()
+        expires_at = now + self.ttl
+        stream_expiry = get_stream_expiry(info)
+        if stream_expiry is not None:
+            expires_at = min(expires_at, stream_expiry - EXPIRY_MARGIN)
+        if expires_at <= now:
+            return
+        with self._lock:
+            try:
+                data = zlib.compress(json.dumps(info, default=str).encode('utf-8'))
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO metadata (key, data, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data), expires_at, now)
+                )
+                self._evict(conn)
+                conn.commit()
+            except Exception:
+                pass
+
+    def _evict(self, conn):
+        conn.execute("DELETE FROM metadata WHERE expires_at <= ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM metadata").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM metadata ORDER BY last_access ASC"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM metadata WHERE key = ?", stale)
+
+    def clear(self):
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM metadata")
+                conn.commit()
+            except Exception:
+                pass
+
+    def stats(self):
+        with self._lock:
+            try:
+                entries, size = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM metadata").fetchone()
+            except Exception:
+                entries, size = 0, 0
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries, 'bytes': size}
@@ -0,0 +1,69 @@
+import os
+import re
+import time
+import threading
+from urllib.parse import unquote
+from .utils import get_data_dir, load_json, atomic_write_json
+
+CHANNEL_ID_URL = re.compile(r'/channel/(UC[0-9A-Za-z_-]{22})')
+CHANNEL_NAME_URL = re.compile(r'/(@[^/?#&]+|c/[^/?#&]+|user/[^/?#&]+)')
+
+
+def channel_id_from_url(url):
+    """The UC... channel ID of a /channel/ URL, or None."""
+    match = CHANNEL_ID_URL.search(url or '')
+    return match.group(1) if match else None
+
+
+def channel_name_key(url):
+    """Cache key for @handle, /c/ and /user/ URLs, e.g. '@somehandle'; None for other URLs.
+
+    YouTube treats these names case-insensitively, so the key is lower-cased.
+    """
+    match = CHANNEL_NAME_URL.search(url or '')
+    return unquote(match.group(1)).lower() if match else None
+
+
+def uploads_playlist_id(channel_id):
+    """A channel's uploads playlist is its ID with UC replaced by UU."""
+    if channel_id and channel_id.startswith('UC'):
+        return 'UU' + channel_id[2:]
+    return None
+
+
+class ChannelIdCache:
+    """Persistent map of channel handles and custom URLs to channel IDs.
+
+    A handle's channel ID never changes for practical purposes, so entries do
+    not expire; resolving a channel costs a network extraction only once.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_data_dir(), 'channels.json')
+        self._lock = threading.Lock()
+        self._ids = self._load()
+
+    def _load(self):
+        return load_json(self.path)
+
+    def _save_locked(self):
+        atomic_write_json(self.path, self._ids)
+
+    def get(self, key):
+        with self._lock:
+            record = self._ids.get(key)
+            return record['channel_id'] if record else None
+
+    def put(self, key, channel_id):
+        with self._lock:
+            self._ids[key] = {'channel_id': channel_id, 'resolved': time.time()}
+            self._save_locked()
+
+    def forget(self, key):
+        with self._lock:
+            if self._ids.pop(key, None) is not None:
+                self._save_locked()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ids)
@@ -0,0 +1,241 @@
+"""Headless batch downloader: ``ytd URL [URL ...]``.
+
+Built only on YouTubeDownloaderCore; nothing here (or in core) imports Qt.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from . import YouTubeDownloaderCore
+from .bandwidth import parse_rate
+from .utils import sanitize_filename, classify_url, get_extractor_call_count
+
+DEFAULT_TEMPLATE = "{playlist}/{title}"
+PROGRESS_INTERVAL = 0.5
+# Stand-in values used to check an output template before any job starts
+SAMPLE_FIELDS = {'title': 'Title', 'id': 'dQw4w9WgXcQ', 'channel': 'Channel', 'channel_id': '@channel',
+                 'playlist': 'Playlist', 'index': 1}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='ytd', description="Download YouTube videos, playlists and channels without a GUI.")
+    parser.add_argument('urls', nargs='*', metavar='URL', help="video, playlist or channel URL")
+    parser.add_argument('-a', '--batch-file', action='append', default=[],
+                        help="file with one URL per line ('-' for stdin); may be repeated")
+    parser.add_argument('-d', '--dir', default='downloads', help="download directory (default: downloads)")
+    parser.add_argument('-o', '--output', default=DEFAULT_TEMPLATE,
+                        help="output name template; fields: title, id, channel, channel_id, playlist, index "
+                             f"(default: {DEFAULT_TEMPLATE})")
+    parser.add_argument('-j', '--jobs', type=int, default=3, help="concurrent downloads (default: 3)")
+    parser.add_argument('-x', '--audio', action='store_true', help="download audio only")
+    parser.add_argument('-f', '--format', help="output format, e.g. mp4, mkv, mp3, m4a (default: mp4, or mp3 with --audio)")
+    parser.add_argument('-q', '--quality', type=int, help="maximum video height, e.g. 1080 (default: best)")
+    parser.add_argument('--limit', type=int, help="maximum number of playlist entries per URL")
+    parser.add_argument('-r', '--limit-rate', type=parse_rate, default=0, metavar='RATE',
+                        help="combined download speed cap for all jobs, e.g. 500K or 4M (default: unlimited)")
+    parser.add_argument('-N', '--connections', type=int, default=1, metavar='N',
+                        help="HTTP range connections per single-file download (default: 1)")
+    parser.add_argument('--force', action='store_true',
+                        help="download again even if the download archive or an existing file says it is done")
+    parser.add_argument('--sync', action='store_true',
+                        help="only download playlist/channel entries not seen by an earlier --sync run")
+    parser.add_argument('--race', type=int, default=1, metavar='N',
+                        help="run the N most successful playlist extraction strategies in parallel (default: 1)")
+    parser.add_argument('--strategy-stats', action='store_true',
+                        help="print playlist extraction strategy statistics as JSON and exit")
+    parser.add_argument('--json', action='store_true', help="write progress as JSON lines to stdout")
+    args = parser.parse_args(argv)
+    try:
+        render_output(args.output, SAMPLE_FIELDS)
+    except (KeyError, IndexError, AttributeError, ValueError) as e:
+        parser.error(f"invalid output template {args.output!r}: {e!r}")
+    return args
+
+
+def read_urls(args):
+    urls = list(args.urls)
+    for path in args.batch_file:
+        stream = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+        try:
+            for line in stream:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    urls.append(line)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+    return urls
+
+
+def render_output(template, fields):
+    """Turn the output template into (subdirectory, title); empty path parts are dropped."""
+    safe_fields = {k: sanitize_filename(v) if isinstance(v, str) else v for k, v in fields.items()}
+    parts = [sanitize_filename(part) for part in template.format(**safe_fields).replace('\\', '/').split('/')]
+    parts = [part for part in parts if part]
+    if not parts:
+        return '', sanitize_filename(fields['title']) or fields['id'] or 'video'
+    return os.path.join(*parts[:-1]) if len(parts) > 1 else '', parts[-1]
+
+
+class Reporter:
+    """Serialises console output from worker threads; JSON lines or plain text."""
+
+    def __init__(self, as_json):
+        self.as_json = as_json
+        self._lock = threading.Lock()
+        self._last_progress = {}
+
+    def emit(self, event, **fields):
+        with self._lock:
+            if self.as_json:
+                print(json.dumps({'event': event, 'time': round(time.time(), 3), **fields}), flush=True)
+            elif event == 'analyzed':
+                print(f"[analyze] {fields['url']}: {fields['type']} ({fields['entries']} item(s), {fields['extractor_calls']} extractor call(s))", flush=True)
+            elif event == 'error':
+                print(f"[error] {fields['url']}: {fields['message']}", file=sys.stderr, flush=True)
+            elif event == 'finished':
+                status = 'done' if fields['success'] else 'FAILED'
+                print(f"[{status}] {fields['title']}: {fields['message']}", flush=True)
+            elif event == 'summary':
+                print(f"{fields['succeeded']}/{fields['total']} downloads succeeded.", flush=True)
+
+    def progress_hook(self, job):
+        def hook(d):
+            if not self.as_json:
+                return
+            now = time.time()
+            if d['status'] == 'downloading' and now - self._last_progress.get(job, 0) < PROGRESS_INTERVAL:
+                return
+            self._last_progress[job] = now
+            self.emit('progress', job=job, status=d['status'],
+                      downloaded_bytes=d.get('downloaded_bytes'),
+                      total_bytes=d.get('total_bytes') or d.get('total_bytes_estimate'),
+                      speed=d.get('speed'), eta=d.get('eta'))
+        return hook
+
+
+def analyze_url(core, reporter, url, limit, submit, sync=False):
+    """Expand one input URL into download jobs, passing each to submit as soon as it is known.
+
+    Playlists and channels are streamed, so their first videos download while
+    later pages are still being listed. With sync, only entries new since the
+    last sync are submitted. Returns the number of jobs, or None if analysis failed.
+    """
+    start = get_extractor_call_count()
+    count = 0
+    is_playlist = classify_url(url) in ('playlist', 'channel')
+    if sync and is_playlist:
+        key, info = core.sync_playlist(url, limit)
+        if info is None:
+            reporter.emit('error', url=url, message="Could not list playlist.")
+            return None
+        playlist = info.get('title', 'Playlist')
+        for index, entry in enumerate(info['entries'], 1):
+            entry_url = core.construct_video_url(entry)
+            if entry_url:
+                submit({'url': entry_url, 'info': None, 'entry': entry, 'playlist': playlist, 'index': index, 'sync_key': key})
+                count += 1
+        reporter.emit('analyzed', url=url, type='playlist', entries=count, extractor_calls=get_extractor_call_count() - start)
+        return count
+    if is_playlist:
+        url_type = 'playlist'
+        index = 0
+        for meta, page in core.stream_playlist(url, limit):
+            playlist = meta.get('title', 'Playlist')
+            for entry in page:
+                index += 1
+                entry_url = core.construct_video_url(entry)
+                if entry_url:
+                    submit({'url': entry_url, 'info': None, 'entry': entry, 'playlist': playlist, 'index': index})
+                    count += 1
+    else:
+        info, url_type, _ = core.analyze(url, limit)
+        if info and url_type == 'playlist':
+            playlist = info.get('title', 'Playlist')
+            for index, entry in enumerate(info.get('entries', []), 1):
+                entry_url = core.construct_video_url(entry)
+                if entry_url:
+                    submit({'url': entry_url, 'info': None, 'entry': entry, 'playlist': playlist, 'index': index})
+                    count += 1
+        elif info:
+            submit({'url': info.get('webpage_url', url), 'info': info, 'entry': info, 'playlist': '', 'index': 1})
+            count = 1
+    if not count:
+        reporter.emit('error', url=url, message="Unsupported URL or analysis failed.")
+        return None
+    reporter.emit('analyzed', url=url, type=url_type, entries=count, extractor_calls=get_extractor_call_count() - start)
+    return count
+
+
+def run_job(core, reporter, args, target_format, job_id, job):
+    entry = job['entry']
+    fields = {
+        'title': entry.get('title') or entry.get('id') or 'video',
+        'id': entry.get('id') or '',
+        'channel': entry.get('uploader') or entry.get('channel') or '',
+        'channel_id': entry.get('uploader_id') or entry.get('channel_id') or '',
+        'playlist': job['playlist'],
+        'index': job['index'],
+    }
+    hooks = [reporter.progress_hook(job_id)]
+    reporter.emit('started', job=job_id, url=job['url'], title=fields['title'])
+    try:
+        subdir, title = render_output(args.output, fields)
+        download_dir = os.path.join(args.dir, subdir) if subdir else args.dir
+        if args.audio:
+            success, msg = core.download_single_audio(job['url'], target_format, title, download_dir, hooks, info=job['info'], force=args.force)
+        else:
+            quality = {'height': args.quality} if args.quality else None
+            success, msg = core.download_single_video(job['url'], quality, target_format, title, download_dir, hooks, info=job['info'], force=args.force)
+    except Exception as e:
+        success, msg = False, str(e)
+    if success and job.get('sync_key'):
+        core.mark_synced(job['sync_key'], [fields['id']])
+    reporter.emit('finished', job=job_id, url=job['url'], title=fields['title'], success=success, message=msg)
+    return success
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.strategy_stats:
+        print(json.dumps(YouTubeDownloaderCore().get_strategy_stats(), indent=2))
+        return 0
+    urls = read_urls(args)
+    if not urls:
+        print("ytd: no URLs given (pass URLs or --batch-file)", file=sys.stderr)
+        return 2
+    target_format = (args.format or ('mp3' if args.audio else 'mp4')).lower()
+    core = YouTubeDownloaderCore()
+    core.set_strategy_race(args.race)
+    core.set_bandwidth_limit(args.limit_rate)
+    core.set_segment_connections(args.connections)
+    if not core.check_ffmpeg():
+        print("ytd: warning: ffmpeg not found in PATH; merging and conversion will fail", file=sys.stderr)
+    reporter = Reporter(args.json)
+    workers = max(1, args.jobs)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        jobs = []
+        jobs_lock = threading.Lock()
+
+        def submit(job):
+            with jobs_lock:
+                jobs.append(pool.submit(run_job, core, reporter, args, target_format, len(jobs) + 1, job))
+
+        analyses = [pool.submit(analyze_url, core, reporter, url, args.limit, submit, args.sync) for url in urls]
+        counts = [analysis.result() for analysis in analyses]
+        results = [job.result() for job in jobs]
+
+    failed = results.count(False)
+    reporter.emit('summary', total=len(results), succeeded=len(results) - failed, failed=failed)
+    if args.sync:
+        # Nothing new is a successful sync
+        return 1 if failed or None in counts else 0
+    return 1 if failed or not results else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
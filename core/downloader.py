@@ -1,31 +1,168 @@
 import os
 import subprocess
 import shutil
-import uuid
-import yt_dlp
-from .utils import sanitize_filename, get_ffmpeg_path, check_ffmpeg
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .utils import sanitize_filename, get_ffmpeg_path, check_ffmpeg, extract_video_id, count_extractor_call
+from .cache import MetadataCache, cache_key
+from .session import ydl_session
+from .planner import plan_formats, audio_format_selector, TRANSCODE_CODECS
+from .journal import JobJournal
+from .archive import DownloadArchive
+from .bandwidth import default_governor
+from .segmented import SegmentedDownloader
 
 CACHE_DIR = '.ytd-cache'
+# Job session dirs get their own subdirectory: CACHE_DIR is also the app data dir's name,
+# so a download dir equal to the app dir must never have its data garbage collected
+JOBS_DIR = os.path.join(CACHE_DIR, 'jobs')
+
+class StreamProgress:
+    """Combines yt-dlp progress of streams fetched in parallel into single progress events.
+
+    Calling cancel() makes the progress hooks of every stream raise DownloadCancelled,
+    which stops the sibling downloads at their next progress update.
+    """
+
+    def __init__(self, streams, progress_hooks=None):
+        self.progress_hooks = progress_hooks or []
+        self.state = {name: {'status': 'downloading', 'downloaded': 0, 'total': 0, 'speed': 0} for name in streams}
+        self.cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def hook(self, name):
+        def progress_hook(d):
+            if self.cancelled.is_set():
+                from yt_dlp.utils import DownloadCancelled
+                raise DownloadCancelled(f"{name} stream cancelled")
+            with self._lock:
+                state = self.state[name]
+                state['status'] = d['status']
+                state['downloaded'] = d.get('downloaded_bytes') or state['downloaded']
+                state['total'] = d.get('total_bytes') or d.get('total_bytes_estimate') or state['total']
+                state['speed'] = (d.get('speed') or 0) if d['status'] == 'downloading' else 0
+                combined = self._combined()
+            for h in self.progress_hooks:
+                h(combined)
+        return progress_hook
+
+    def _combined(self):
+        states = self.state.values()
+        downloaded = sum(s['downloaded'] for s in states)
+        total = sum(s['total'] for s in states)
+        speed = sum(s['speed'] for s in states)
+        if all(s['status'] == 'finished' for s in states):
+            return {'status': 'finished', 'downloaded_bytes': downloaded, 'total_bytes': total}
+        eta = int((total - downloaded) / speed) if speed and total else None
+        return {
+            'status': 'downloading',
+            'downloaded_bytes': downloaded,
+            'total_bytes': total or None,
+            'speed': speed,
+            'eta': eta,
+        }
+
 
 class VideoDownloader:
-    def __init__(self):
+    def __init__(self, metadata_cache=None, archive=None, governor=None):
         self.ffmpeg_path = get_ffmpeg_path()
+        self.metadata_cache = metadata_cache or MetadataCache()
+        self.archive = archive or DownloadArchive()
+        self.governor = governor or default_governor
+        self.segment_connections = 1   # > 1 fetches progressive files over parallel ranged connections
+        self._segmented = None
+        self._segmented_lock = threading.Lock()
+        self._journals = {}
+        self._journals_lock = threading.Lock()
+        self._reserved = {}   # normalised final path -> video ID of the running job that will write it
+        self._reserved_lock = threading.Lock()
     
     def check_executable_paths(self):
         """Check if ffmpeg is available in PATH. Returns list of missing executables."""
         missing = []
-        if not shutil.which('ffmpeg'):
+        if not check_ffmpeg():
             missing.append('ffmpeg')
         return missing
     
     def _get_cache_dir(self, download_dir, session_id=None):
-        """Get cache directory path inside download directory."""
-        cache_path = os.path.join(download_dir, CACHE_DIR)
+        """Get the job cache directory path inside download directory."""
+        cache_path = os.path.join(download_dir, JOBS_DIR)
         if session_id:
             cache_path = os.path.join(cache_path, session_id)
         os.makedirs(cache_path, exist_ok=True)
         return cache_path
     
+    def set_segment_connections(self, connections):
+        with self._segmented_lock:
+            self.segment_connections = max(1, int(connections or 1))
+            old, self._segmented = self._segmented, None
+        if old is not None:
+            old.close()  # Releases its pooled connections; a download still using it opens fresh ones
+
+    def _get_segmented(self):
+        with self._segmented_lock:
+            if self._segmented is None:
+                self._segmented = SegmentedDownloader(self.segment_connections)
+            return self._segmented
+
+    def get_journal(self, download_dir):
+        """Job journal for a download directory; orphaned sessions are collected on first use."""
+        cache_root = os.path.abspath(self._get_cache_dir(download_dir))
+        with self._journals_lock:
+            journal = self._journals.get(cache_root)
+            if journal is None:
+                journal = self._journals[cache_root] = JobJournal(cache_root)
+                journal.collect_garbage()
+        return journal
+
+    def _check_archive(self, video_id, kind, final_file, force=False):
+        """Resolve the output path against the download archive before any network activity.
+
+        Returns (final_file, skip_message); skip_message is None when a download is needed.
+        A returned path is reserved for this job until _release_path(), so parallel
+        jobs whose titles sanitize alike never move their files onto each other.
+        With force the archive and existing files are ignored and final_file is overwritten.
+        """
+        if video_id and not force:
+            record = self.archive.lookup(video_id, kind)
+            if record:
+                return final_file, f"Already downloaded: {record['path'] or 'recorded in archive'}"
+        with self._reserved_lock:
+            key = os.path.normcase(os.path.abspath(final_file))
+            if key in self._reserved:
+                owner = self._reserved[key]
+            elif not force and os.path.exists(final_file):
+                owner = (self.archive.owner_of(final_file) or (None,))[0]
+            else:
+                self._reserved[key] = video_id
+                return final_file, None
+            if owner == video_id or not video_id or (owner is None and key not in self._reserved):
+                # The same video, or an existing file nobody recorded
+                return final_file, "File already exists, skipping..."
+            # Same title, different video: keep both
+            base, ext = os.path.splitext(final_file)
+            final_file = f"{base} [{video_id}]{ext}"
+            key = os.path.normcase(os.path.abspath(final_file))
+            if key in self._reserved or (not force and os.path.exists(final_file)):
+                return final_file, "File already exists, skipping..."
+            self._reserved[key] = video_id
+            return final_file, None
+
+    def _release_path(self, final_file):
+        with self._reserved_lock:
+            self._reserved.pop(os.path.normcase(os.path.abspath(final_file)), None)
+
+    def _begin_job(self, download_dir, url, info, plan_key, final_file):
+        video_id = (info or {}).get('id') or extract_video_id(url) or url
+        journal = self.get_journal(download_dir)
+        job_key = journal.job_key(video_id, plan_key)
+        session_id = journal.begin(job_key, url=url, final_file=os.path.basename(final_file))
+        return journal, job_key, self._get_cache_dir(download_dir, session_id)
+
     def _cleanup_cache(self, cache_dir):
         """Remove cache directory and all its contents."""
         try:
@@ -34,18 +171,50 @@ class VideoDownloader:
         except Exception:
             pass
 
-    def get_video_info(self, url):
-        ydl_opts = {
+    def _info_opts(self):
+        return {
             'quiet': True,
             'no_warnings': True,
             'ffmpeg_location': self.ffmpeg_path,
         }
+
+    def _store_info(self, info):
+        if info and info.get('id') and info.get('_type', 'video') == 'video':
+            self.metadata_cache.put(cache_key(info.get('extractor_key'), info['id']), info)
+
+    def get_video_info(self, url, use_cache=True):
+        video_id = extract_video_id(url)
+        if use_cache and video_id:
+            info = self.metadata_cache.get(cache_key('youtube', video_id))
+            if info:
+                return info
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with ydl_session(self._info_opts()) as ydl:
+                count_extractor_call()
                 info = ydl.extract_info(url, download=False)
-                return info
         except Exception:
             return None
+        self._store_info(info)
+        return info
+
+    def extract_partial_info(self, url):
+        """Run the extractor once without resolving formats or playlist entries."""
+        try:
+            with ydl_session(self._info_opts()) as ydl:
+                count_extractor_call()
+                return ydl.extract_info(url, download=False, process=False)
+        except Exception:
+            return None
+
+    def process_partial_info(self, partial):
+        """Resolve formats of an extract_partial_info result into full video info."""
+        try:
+            with ydl_session(self._info_opts()) as ydl:
+                info = ydl.process_ie_result(partial, download=False)
+        except Exception:
+            return None
+        self._store_info(info)
+        return info
 
     def get_quality_options(self, info):
         formats = info.get('formats', [])
@@ -70,49 +239,99 @@ class VideoDownloader:
         sorted_qualities = sorted(quality_options.items(), key=lambda x: x[1]['height'], reverse=True)
         return sorted_qualities
 
-    def download_single_video(self, url, selected_format, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None):
+    def plan_download(self, url, selected_format, target_format, info=None):
+        """Decide how a video will be fetched. Uses cached info when available."""
+        if info is None:
+            info = self.get_video_info(url)
+        return plan_formats(info, selected_format, target_format)
+
+    def download_single_video(self, url, selected_format, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None, info=None, weight=1.0, force=False):
         if not download_dir:
             download_dir = "downloads"
         os.makedirs(download_dir, exist_ok=True)
-        session_id = str(uuid.uuid4())
-        cache_dir = self._get_cache_dir(download_dir, session_id)
         
         if channel and channel_id:
             title += f" - [{channel} - @{channel_id}]"
             
         safe_title = sanitize_filename(title)
-        temp_video = os.path.join(cache_dir, f"temp_video_{safe_title}")
-        temp_audio = os.path.join(cache_dir, f"temp_audio_{safe_title}")
-        final_file = os.path.join(download_dir, f"{safe_title}.{target_format}")
-        
-        if os.path.exists(final_file):
-            return True, "File already exists, skipping..."
+        video_id = (info or {}).get('id') or extract_video_id(url)
+        final_file, skip_msg = self._check_archive(video_id, 'video', os.path.join(download_dir, f"{safe_title}.{target_format}"), force)
+        if skip_msg:
+            return True, skip_msg
+        # Every stream of this job draws from one share of the global bandwidth limit
+        throttle = self.governor.register(weight)
+        progress_hooks = list(progress_hooks or []) + [throttle.hook]
         try:
-            direct_success = self._try_direct_download(url, selected_format, target_format, final_file, cache_dir, progress_hooks)
-            if direct_success:
-                return True, "Downloaded successfully (direct)"
-            if not check_ffmpeg():
-                return False, "FFmpeg required for video+audio merge!"
-            success = self._download_and_merge_video(url, selected_format, target_format,
-                                                temp_video, temp_audio, final_file, progress_hooks)
-            if success:
-                return True, "Downloaded and merged successfully"
+            if info is None:
+                info = self.get_video_info(url)
+            plan = plan_formats(info, selected_format, target_format)
+            if plan.needs_ffmpeg and not check_ffmpeg():
+                return False, f"FFmpeg required for {plan.mode}!"
+
+            # Partial data stays in the journaled session dir until the job succeeds
+            journal, job_key, cache_dir = self._begin_job(download_dir, url, info, plan.key, final_file)
+            if plan.mode == 'merge':
+                temp_video = os.path.join(cache_dir, f"temp_video_{safe_title}")
+                temp_audio = os.path.join(cache_dir, f"temp_audio_{safe_title}")
+                success = self._download_and_merge_video(url, plan, temp_video, temp_audio, final_file, progress_hooks, info)
+                msg = "Downloaded and merged successfully" if success else "Download/Merge failed"
             else:
-                return False, "Download/Merge failed"
+                success = self._download_direct(url, plan, final_file, cache_dir, progress_hooks, info)
+                msg = f"Downloaded successfully ({plan.mode})" if success else "Download failed"
+            if success:
+                journal.finish(job_key)
+                if video_id:
+                    self.archive.add(video_id, 'video', final_file, target_format)
+            return success, msg
         except Exception as e:
             return False, f"Download error: {str(e)}"
+        finally:
+            self.governor.unregister(throttle)
+            self._release_path(final_file)
 
-    def _try_direct_download(self, url, selected_format, target_format, output_file, cache_dir, progress_hooks=None):
+    def _run_download(self, ydl, url, info=None):
+        """Download with already-extracted info when we have it, re-extracting only if that fails."""
+        # Compact info restored from the queue store has no stream URLs
+        if info and not info.get('_compact'):
+            try:
+                ydl.process_ie_result(copy.deepcopy(info), download=True)
+                return True
+            except Exception as e:
+                from yt_dlp.utils import DownloadCancelled
+                if isinstance(e, DownloadCancelled):
+                    raise
+        return ydl.download([url]) == 0
+
+    def _try_segmented(self, plan, cache_file, progress_hooks=None):
+        """Fetch a progressive file over several ranged connections; False means let yt-dlp fetch it."""
+        segmented = self._get_segmented()
+        fmt = plan.video_format or {}
+        if (self.segment_connections < 2 or not fmt.get('url') or fmt.get('protocol') not in ('http', 'https')
+                or os.path.exists(cache_file + '.part')):
+            # yt-dlp fetches it; a yt-dlp partial from an earlier attempt is resumed, never overwritten
+            segmented.discard(cache_file)
+            return False
+        try:
+            return segmented.download(fmt['url'], cache_file, fmt.get('http_headers'), fmt.get('filesize'), progress_hooks)
+        except Exception as e:
+            from yt_dlp.utils import DownloadCancelled
+            if isinstance(e, DownloadCancelled):
+                raise  # Ranges are kept so the next attempt resumes them
+            # No range support, expired URL or a short read: fall back to a single connection
+            segmented.discard(cache_file)
+            return False
+
+    def _download_direct(self, url, plan, output_file, cache_dir, progress_hooks=None, info=None):
         try:
             cache_output = os.path.join(cache_dir, os.path.basename(output_file))
-            
-            if selected_format:
-                format_selector = f"best[height<={selected_format['height']}][acodec!=none]/best[height<={selected_format['height']}]/best"
-            else:
-                format_selector = "best[acodec!=none]/best"
+            if plan.mode == 'progressive' and self._try_segmented(plan, cache_output, progress_hooks):
+                shutil.move(cache_output, output_file)
+                self._cleanup_cache(cache_dir)
+                return True
             ydl_opts = {
-                'format': format_selector,
-                'outtmpl': cache_output.replace('.mp4', '.%(ext)s'),
+                'format': plan.video_spec,
+                'outtmpl': os.path.splitext(cache_output)[0] + '.%(ext)s',
+                'continuedl': True,
                 'quiet': True,
                 'no_warnings': True,
                 'writeinfojson': False,
@@ -121,18 +340,20 @@ class VideoDownloader:
             if progress_hooks:
                 ydl_opts['progress_hooks'] = progress_hooks
 
-            if target_format.lower() != 'mp4':
+            if plan.mode == 'remux':
                 ydl_opts['postprocessors'] = [{
-                    'key': 'FFmpegVideoConvertor',
-                    'preferedformat': target_format.lower(),
+                    'key': 'FFmpegVideoRemuxer' if plan.stream_copy else 'FFmpegVideoConvertor',
+                    'preferedformat': plan.target_format,
                 }]
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            elif plan.mode == 'auto':
+                ydl_opts['merge_output_format'] = plan.target_format
+            with ydl_session(ydl_opts) as ydl:
+                self._run_download(ydl, url, info)
             
             # Check for downloaded file in cache and move to destination
-            possible_exts = [target_format, 'mp4', 'webm', 'mkv']
+            possible_exts = [plan.target_format, 'mp4', 'webm', 'mkv']
             for ext in possible_exts:
-                cache_file = os.path.join(cache_dir, os.path.basename(output_file).replace(f'.{target_format}', f'.{ext}'))
+                cache_file = os.path.splitext(cache_output)[0] + f'.{ext}'
                 if os.path.exists(cache_file) and os.path.getsize(cache_file) > 1024:
                     shutil.move(cache_file, output_file)
                     self._cleanup_cache(cache_dir)
@@ -143,40 +364,42 @@ class VideoDownloader:
         except Exception:
             return False
 
-    def _download_and_merge_video(self, url, selected_format, target_format,
-                                temp_video, temp_audio, final_file, progress_hooks=None):
+    def _download_and_merge_video(self, url, plan, temp_video, temp_audio, final_file, progress_hooks=None, info=None):
         try:
-            video_format = f"best[height<={selected_format['height']}][vcodec!=none]/best[vcodec!=none]" if selected_format else "best[vcodec!=none]"
+            progress = StreamProgress(['video', 'audio'], progress_hooks)
             video_opts = {
-                'format': video_format,
+                'format': plan.video_spec,
                 'outtmpl': temp_video + '.%(ext)s',
+                'continuedl': True,
                 'quiet': True,
                 'no_warnings': True,
                 'ffmpeg_location': self.ffmpeg_path,
+                'progress_hooks': [progress.hook('video')],
             }
-            if progress_hooks:
-                video_opts['progress_hooks'] = progress_hooks
-            
-            with yt_dlp.YoutubeDL(video_opts) as ydl:
-                ydl.download([url])
-            
             audio_opts = {
-                'format': 'bestaudio/best',
+                'format': plan.audio_spec,
                 'outtmpl': temp_audio + '.%(ext)s',
+                'continuedl': True,
                 'quiet': True,
                 'no_warnings': True,
                 'ffmpeg_location': self.ffmpeg_path,
+                'progress_hooks': [progress.hook('audio')],
             }
-            if progress_hooks:
-                audio_opts['progress_hooks'] = progress_hooks
 
-            with yt_dlp.YoutubeDL(audio_opts) as ydl:
-                ydl.download([url])
+            # Fetch both streams at once; a failure on either side cancels its sibling
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(self._fetch_stream, url, opts, progress, info)
+                           for opts in (video_opts, audio_opts)]
+                if not all(f.result() for f in futures):
+                    return False
             video_file = self._find_downloaded_file(temp_video)
             audio_file = self._find_downloaded_file(temp_audio)
             if not video_file or not audio_file:
                 return False
-            success = self._merge_files(video_file, audio_file, final_file)
+            success = self._merge_files(video_file, audio_file, final_file, plan)
+            if not success:
+                # Keep the fetched streams so a retry only has to redo the merge
+                return False
             try:
                 if os.path.exists(video_file):
                     os.remove(video_file)
@@ -191,6 +414,16 @@ class VideoDownloader:
         except Exception:
             return False
 
+    def _fetch_stream(self, url, opts, progress, info=None):
+        try:
+            with ydl_session(opts) as ydl:
+                if self._run_download(ydl, url, info):
+                    return True
+        except Exception:
+            pass
+        progress.cancel()
+        return False
+
     def _find_downloaded_file(self, base_path):
         for ext in ['mp4', 'webm', 'mkv', 'm4a', 'mp3', 'wav']:
             file_path = f"{base_path}.{ext}"
@@ -198,60 +431,77 @@ class VideoDownloader:
                 return file_path
         return None
 
-    def _merge_files(self, video_file, audio_file, output_file):
+    def _merge_command(self, video_file, audio_file, output_file, container, video_copy, audio_copy):
+        encoders = TRANSCODE_CODECS.get(container, TRANSCODE_CODECS['mkv'])
+        return [
+            self.ffmpeg_path,
+            '-i', video_file,
+            '-i', audio_file,
+            '-map', '0:v:0',
+            '-map', '1:a:0',
+            '-c:v', 'copy' if video_copy else encoders['video'],
+            '-c:a', 'copy' if audio_copy else encoders['audio'],
+            '-y',
+            output_file
+        ]
+
+    def _merge_files(self, video_file, audio_file, output_file, plan=None):
+        """Merge with ffmpeg, stream-copying video whenever ffmpeg can mux it into the container.
+
+        Video is always tried as a copy first, whatever the plan says, because
+        codec names in format lists are not exhaustive and a transcode costs
+        far more than a failed copy. Audio is transcoded next, and video only
+        as a last resort.
+        """
         try:
-            cmd = [
-                self.ffmpeg_path,
-                '-i', video_file,
-                '-i', audio_file,
-                '-c:v', 'copy',
-                '-c:a', 'aac', 
-                '-y', 
-                output_file
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0 and os.path.exists(output_file):
-                return True
-                
-            cmd_copy = [
-                self.ffmpeg_path,
-                '-i', video_file,
-                '-i', audio_file,
-                '-c', 'copy',
-                '-y', 
-                output_file
-            ]
-            result = subprocess.run(cmd_copy, capture_output=True, text=True)
-            return result.returncode == 0 and os.path.exists(output_file)
+            container = os.path.splitext(output_file)[1].lstrip('.').lower()
+            audio_copy = plan.audio_copy if plan else False
+            attempts = [(True, audio_copy)]
+            if audio_copy:
+                attempts.append((True, False))
+            attempts.append((False, False))
+            for video_copy, copy_audio in attempts:
+                cmd = self._merge_command(video_file, audio_file, output_file, container, video_copy, copy_audio)
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode == 0 and os.path.exists(output_file):
+                    return True
+            return False
 
         except Exception:
             return False
 
-    def download_single_audio(self, url, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None):
+    def _finish_audio(self, journal, job_key, video_id, final_file, target_format):
+        journal.finish(job_key)
+        if video_id:
+            self.archive.add(video_id, 'audio', final_file, target_format)
+
+    def download_single_audio(self, url, target_format, title, download_dir="downloads", progress_hooks=None, channel=None, channel_id=None, info=None, weight=1.0, force=False):
         if not download_dir:
             download_dir = "downloads"
         os.makedirs(download_dir, exist_ok=True)
-        session_id = str(uuid.uuid4())
-        cache_dir = self._get_cache_dir(download_dir, session_id)
         
         if channel and channel_id:
             title += f" - [{channel} - @{channel_id}]"
             
         safe_title = sanitize_filename(title)
-        final_file = os.path.join(download_dir, f"{safe_title}.{target_format}")
-        
-        if os.path.exists(final_file):
-            return True, "File already exists, skipping..."
+        video_id = (info or {}).get('id') or extract_video_id(url)
+        final_file, skip_msg = self._check_archive(video_id, 'audio', os.path.join(download_dir, f"{safe_title}.{target_format}"), force)
+        if skip_msg:
+            return True, skip_msg
+        throttle = self.governor.register(weight)
+        progress_hooks = list(progress_hooks or []) + [throttle.hook]
         try:
+            format_selector = audio_format_selector(target_format)
+            journal, job_key, cache_dir = self._begin_job(download_dir, url, info, f"audio:{format_selector}:{target_format}", final_file)
             ydl_opts = {
-                'format': 'bestaudio/best',
+                'format': format_selector,
                 'outtmpl': os.path.join(cache_dir, f'{safe_title}.%(ext)s'),
                 'postprocessors': [{
                     'key': 'FFmpegExtractAudio',
                     'preferredcodec': target_format.lower(),
                     'preferredquality': '320',
                 }],
+                'continuedl': True,
                 'quiet': True,
                 'no_warnings': True,
                 'ffmpeg_location': self.ffmpeg_path,
@@ -259,14 +509,15 @@ class VideoDownloader:
             if progress_hooks:
                 ydl_opts['progress_hooks'] = progress_hooks
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            with ydl_session(ydl_opts) as ydl:
+                self._run_download(ydl, url, info)
             
             # Check for file in cache and move to destination
             cache_file = os.path.join(cache_dir, f"{safe_title}.{target_format}")
             if os.path.exists(cache_file) and os.path.getsize(cache_file) > 1024:
                 shutil.move(cache_file, final_file)
                 self._cleanup_cache(cache_dir)
+                self._finish_audio(journal, job_key, video_id, final_file, target_format)
                 return True, "Audio downloaded successfully"
             else:
                 for ext in ['mp3', 'm4a', 'wav', 'flac']:
@@ -274,9 +525,12 @@ class VideoDownloader:
                     if os.path.exists(alt_file):
                         shutil.move(alt_file, final_file)
                         self._cleanup_cache(cache_dir)
+                        self._finish_audio(journal, job_key, video_id, final_file, target_format)
                         return True, "Audio downloaded successfully (converted)"
-                self._cleanup_cache(cache_dir)
                 return False, "Audio download failed"
         except Exception as e:
-            self._cleanup_cache(cache_dir)
+            # Partial data is kept in the session dir so a retry can resume
             return False, f"Audio download error: {str(e)}"
+        finally:
+            self.governor.unregister(throttle)
+            self._release_path(final_file)
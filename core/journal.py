@@ -0,0 +1,84 @@
+import os
+import re
+import time
+import uuid
+import shutil
+import threading
+from .utils import load_json, atomic_write_json
+
+JOURNAL_FILE = 'journal.json'
+JOB_MAX_AGE = 7 * 24 * 60 * 60       # Unfinished jobs untouched this long are abandoned
+ORPHAN_GRACE = 60 * 60               # Unjournaled session dirs younger than this are left alone
+SESSION_NAME = re.compile(r'[0-9a-f]{32}')   # uuid4().hex; nothing else in cache_root is ever deleted
+
+
+class JobJournal:
+    """Persistent record of unfinished downloads inside a download directory's cache.
+
+    Each job is keyed by (video ID, format plan) and owns one session directory,
+    so a restarted download of the same video with the same plan lands in the
+    same place and yt-dlp resumes its .part files and fragments instead of
+    starting over.
+    """
+
+    def __init__(self, cache_root):
+        self.cache_root = cache_root
+        self.path = os.path.join(cache_root, JOURNAL_FILE)
+        self._lock = threading.Lock()
+        self.jobs = self._load()
+
+    @staticmethod
+    def job_key(video_id, plan_key):
+        return f"{video_id}|{plan_key}"
+
+    def _load(self):
+        return load_json(self.path)
+
+    def _save_locked(self):
+        atomic_write_json(self.path, self.jobs)
+
+    def begin(self, key, **meta):
+        """Return the session ID for a job, reusing the one from an earlier interrupted run."""
+        now = time.time()
+        with self._lock:
+            job = self.jobs.get(key)
+            if job is None or not os.path.isdir(os.path.join(self.cache_root, job['session'])):
+                job = {'session': uuid.uuid4().hex, 'created': now}
+                self.jobs[key] = job
+            job.update(meta)
+            job['updated'] = now
+            job['attempts'] = job.get('attempts', 0) + 1
+            self._save_locked()
+            return job['session']
+
+    def finish(self, key):
+        with self._lock:
+            if self.jobs.pop(key, None) is not None:
+                self._save_locked()
+
+    def collect_garbage(self, max_age=JOB_MAX_AGE):
+        """Drop jobs abandoned for max_age and delete session dirs no job refers to."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for key, job in list(self.jobs.items()):
+                if now - job.get('updated', 0) > max_age:
+                    del self.jobs[key]
+            self._save_locked()
+            live = {job['session'] for job in self.jobs.values()}
+        try:
+            names = os.listdir(self.cache_root)
+        except OSError:
+            return removed
+        for name in names:
+            path = os.path.join(self.cache_root, name)
+            if name in live or not SESSION_NAME.fullmatch(name) or not os.path.isdir(path):
+                continue
+            try:
+                if now - os.path.getmtime(path) < ORPHAN_GRACE:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        return removed
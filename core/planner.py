@@ -0,0 +1,149 @@
+# Codecs each container can hold without transcoding (prefix match on yt-dlp codec strings).
+# None means the container accepts anything ffmpeg can stream-copy.
+CONTAINER_CODECS = {
+    'mp4': {'video': ('avc1', 'h264', 'hev1', 'hvc1', 'hevc', 'h265', 'av01', 'av1', 'vp09', 'vp9'), 'audio': ('mp4a', 'aac', 'mp3', 'ac-3', 'ec-3', 'alac', 'flac')},
+    'm4a': {'video': (), 'audio': ('mp4a', 'aac', 'alac')},
+    'webm': {'video': ('vp8', 'vp9', 'vp09', 'av01', 'av1'), 'audio': ('opus', 'vorbis')},
+    'mkv': {'video': None, 'audio': None},
+}
+
+# ffmpeg encoders used when a stream has to be transcoded into a container
+TRANSCODE_CODECS = {
+    'mp4': {'video': 'libx264', 'audio': 'aac'},
+    'webm': {'video': 'libvpx-vp9', 'audio': 'libopus'},
+    'mkv': {'video': 'libx264', 'audio': 'aac'},
+}
+
+
+def codec_fits(codec, container, kind):
+    """True if a stream with this codec can be stream-copied into container."""
+    allowed = CONTAINER_CODECS.get(container, {}).get(kind, ())
+    if allowed is None:
+        return True
+    codec = (codec or '').lower()
+    return bool(codec) and codec.startswith(allowed)
+
+
+def _has_video(f):
+    return bool(f.get('vcodec')) and f.get('vcodec') != 'none'
+
+
+def _has_audio(f):
+    return bool(f.get('acodec')) and f.get('acodec') != 'none'
+
+
+def _fits(f, container):
+    return codec_fits(f.get('vcodec'), container, 'video') and codec_fits(f.get('acodec'), container, 'audio')
+
+
+def _video_rank(f):
+    return (f.get('height') or 0, f.get('fps') or 0, f.get('tbr') or f.get('vbr') or 0)
+
+
+def _audio_rank(f):
+    return (f.get('abr') or f.get('tbr') or 0, f.get('asr') or 0)
+
+
+class FormatPlan:
+    """Decision on how a single video is fetched, made before any bytes are downloaded.
+
+    mode is one of:
+      'progressive' - one file with audio and video, already in the target container
+      'remux'       - one file with audio and video, rewrapped into the target container
+      'merge'       - separate video-only and audio-only streams merged with ffmpeg
+      'auto'        - no format list available; yt-dlp selects at download time
+    """
+
+    def __init__(self, mode, target_format, video_format=None, audio_format=None, format_spec=None, reason=''):
+        self.mode = mode
+        self.target_format = target_format
+        self.video_format = video_format
+        self.audio_format = audio_format
+        self.format_spec = format_spec
+        self.reason = reason
+        video = video_format or {}
+        audio = audio_format or video
+        self.video_copy = not video or codec_fits(video.get('vcodec'), target_format, 'video')
+        self.audio_copy = not audio or codec_fits(audio.get('acodec'), target_format, 'audio')
+
+    @property
+    def stream_copy(self):
+        return self.video_copy and self.audio_copy
+
+    @property
+    def needs_ffmpeg(self):
+        return self.mode in ('remux', 'merge', 'auto')
+
+    @property
+    def video_spec(self):
+        return self.video_format['format_id'] if self.video_format else self.format_spec
+
+    @property
+    def audio_spec(self):
+        return self.audio_format['format_id'] if self.audio_format else 'bestaudio/best'
+
+    @property
+    def key(self):
+        """Stable identifier of what this plan downloads, used to match interrupted jobs."""
+        audio = self.audio_spec if self.mode == 'merge' else ''
+        return f"{self.mode}:{self.video_spec}:{audio}:{self.target_format}"
+
+    def to_dict(self):
+        return {
+            'mode': self.mode,
+            'target_format': self.target_format,
+            'video_format': self.video_spec,
+            'audio_format': self.audio_spec if self.mode == 'merge' else None,
+            'height': (self.video_format or {}).get('height'),
+            'video_copy': self.video_copy,
+            'audio_copy': self.audio_copy,
+            'reason': self.reason,
+        }
+
+    def __repr__(self):
+        return f"FormatPlan({self.to_dict()!r})"
+
+
+def audio_format_selector(target_format):
+    """yt-dlp format selector that favours audio already encoded for target_format."""
+    target_format = target_format.lower()
+    if target_format in ('m4a', 'aac'):
+        return 'bestaudio[acodec^=mp4a]/bestaudio/best'
+    if target_format in ('opus', 'webm', 'ogg'):
+        return 'bestaudio[acodec=opus]/bestaudio/best'
+    return 'bestaudio/best'
+
+
+def plan_formats(info, selected_format, target_format):
+    """Choose between progressive download, remux and DASH merge from info['formats']."""
+    target_format = target_format.lower()
+    max_height = selected_format.get('height') if selected_format else None
+    formats = [f for f in (info or {}).get('formats') or [] if f.get('format_id')]
+
+    videos = [f for f in formats if _has_video(f) and (not max_height or (f.get('height') or 0) <= max_height)]
+    if not videos:
+        height_filter = f"[height<={max_height}]" if max_height else ""
+        return FormatPlan('auto', target_format,
+                          format_spec=f"bestvideo{height_filter}+bestaudio/best{height_filter}/best",
+                          reason="no usable format list")
+
+    best_height = max(f.get('height') or 0 for f in videos)
+    progressive = [f for f in videos if _has_audio(f) and (f.get('height') or 0) >= best_height]
+    if progressive:
+        chosen = max(progressive, key=lambda f: (_fits(f, target_format), _video_rank(f)))
+        mode = 'progressive' if chosen.get('ext') == target_format else 'remux'
+        return FormatPlan(mode, target_format, video_format=chosen,
+                          reason=f"progressive {chosen.get('ext')} reaches {best_height}p")
+
+    video_only = [f for f in videos if not _has_audio(f) and (f.get('height') or 0) >= best_height]
+    audio_only = [f for f in formats if _has_audio(f) and not _has_video(f)]
+    if video_only and audio_only:
+        # Prefer streams the target container can hold as-is, so the merge is a pure stream copy
+        video = max(video_only, key=lambda f: (codec_fits(f.get('vcodec'), target_format, 'video'), _video_rank(f)))
+        audio = max(audio_only, key=lambda f: (codec_fits(f.get('acodec'), target_format, 'audio'), _audio_rank(f)))
+        return FormatPlan('merge', target_format, video_format=video, audio_format=audio,
+                          reason=f"{best_height}p only available as separate streams")
+
+    chosen = max(videos, key=_video_rank)
+    mode = 'progressive' if chosen.get('ext') == target_format else 'remux'
+    return FormatPlan(mode, target_format, video_format=chosen, reason="no separate audio stream")
@@ -1,40 +1,117 @@
 import os
 import re
-import yt_dlp
-from .utils import get_ffmpeg_path
+import time
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .utils import get_ffmpeg_path, count_extractor_call, get_extractor_counter, use_extractor_counter
+from .session import ydl_session
+from .strategy import StrategyMemory, classify_playlist_url
+from .channels import ChannelIdCache, channel_id_from_url, channel_name_key, uploads_playlist_id
+
+STREAM_PAGE_SIZE = 100     # Entries per yielded page; YouTube continuation pages hold about this many
+MAX_REDIRECTS = 3
 
 class PlaylistExtractor:
-    def __init__(self):
+    # Extraction strategies, in the order tried when nothing is known about a URL class
+    STRATEGIES = ('flat', 'in_playlist', 'full', 'flat_playlist', 'channel', 'fallback')
+    # Only flat listings are raced; 'full' extracts every video and is far too costly to run speculatively
+    RACE_STRATEGIES = ('flat', 'in_playlist', 'flat_playlist', 'channel')
+
+    def __init__(self, strategy_memory=None, race=1, channel_ids=None):
         self.ffmpeg_path = get_ffmpeg_path()
+        self.channel_ids = channel_ids if channel_ids is not None else ChannelIdCache()
+        self.strategy_memory = strategy_memory or StrategyMemory()
+        self.race = race  # How many of the best-ranked strategies to run in parallel
 
     def get_playlist_info(self, url, limit=None):
         url = self.preprocess_playlist_url(url)
-        
-        def apply_limit(opts):
-            if limit:
-                opts['playlistend'] = limit
-            else:
-                if 'playlistend' in opts:
-                    del opts['playlistend']
-            return opts
-
-        methods = [
-            apply_limit({
+        url_class = classify_playlist_url(url)
+        is_channel = 'channel' in url.lower() or '/@' in url or '/user/' in url
+        strategies = [name for name in self.STRATEGIES if name != 'channel' or is_channel]
+        ranked = self.strategy_memory.rank(url_class, strategies)
+        if self.race > 1:
+            racers = [name for name in ranked if name in self.RACE_STRATEGIES][:self.race]
+            result = self._race_strategies(url, url_class, racers, limit)
+            if result:
+                return result
+            ranked = [name for name in ranked if name not in racers]
+        for name in ranked:
+            result = self._attempt_strategy(url, url_class, name, limit)
+            if result:
+                return result
+        return None
+
+    def _attempt_strategy(self, url, url_class, name, limit, cancelled=None):
+        start = time.perf_counter()
+        try:
+            result = self._run_strategy(name, url, limit, cancelled)
+        except Exception:
+            result = None
+        if cancelled is not None and cancelled.is_set() and not result:
+            return None  # Lost a race; its cut-short run says nothing about the strategy
+        self.strategy_memory.record(url_class, name, bool(result), time.perf_counter() - start,
+                                    self.STRATEGIES.index(name))
+        return result
+
+    def _race_strategies(self, url, url_class, names, limit):
+        """Run several strategies at once and return the first success; the others are cancelled."""
+        if not names:
+            return None
+        cancelled = threading.Event()
+        # Race threads count their extractor calls into the caller's counter
+        pool = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix='playlist-strategy',
+                                  initializer=use_extractor_counter, initargs=(get_extractor_counter(),))
+        futures = [pool.submit(self._attempt_strategy, url, url_class, name, limit, cancelled) for name in names]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if result:
+                    return result
+            return None
+        finally:
+            # Losers stop at their next playlist entry instead of listing the rest in the background
+            cancelled.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _cancel_filter(cancelled):
+        """yt-dlp match_filter that aborts the extraction once cancelled is set."""
+        def match_filter(info, incomplete=False):
+            if cancelled.is_set():
+                from yt_dlp.utils import DownloadCancelled
+                raise DownloadCancelled("Lost the strategy race")
+            return None
+        return match_filter
+
+    def _run_strategy(self, name, url, limit, cancelled=None):
+        if name == 'fallback':
+            return self.fallback_playlist_extraction(url)
+        options = self._strategy_options('flat' if name == 'channel' else name, limit)
+        if cancelled is not None:
+            options['match_filter'] = self._cancel_filter(cancelled)
+        if name == 'channel':
+            return self.handle_channel_url(url, options)
+        return self._extract_with_options(url, options)
+
+    def _strategy_options(self, name, limit):
+        options = {
+            'flat': {
                 'quiet': True,
                 'no_warnings': True,
                 'extract_flat': True,
                 'ignoreerrors': True,
                 'ffmpeg_location': self.ffmpeg_path,
-            }),
-            apply_limit({
+            },
+            'in_playlist': {
                 'quiet': True,
                 'no_warnings': True,
                 'extract_flat': 'in_playlist',
                 'ignoreerrors': True,
                 'playlistreverse': False,
                 'ffmpeg_location': self.ffmpeg_path,
-            }),
-            apply_limit({
+            },
+            'full': {
                 'quiet': True,
                 'no_warnings': True,
                 'extract_flat': False,
@@ -42,43 +119,110 @@ class PlaylistExtractor:
                 'ignoreerrors': True,
                 'writeinfojson': False,
                 'ffmpeg_location': self.ffmpeg_path,
-            }),
-            apply_limit({
+            },
+            'flat_playlist': {
                 'quiet': True,
                 'no_warnings': True,
                 'flat_playlist': True,
                 'ignoreerrors': True,
                 'ffmpeg_location': self.ffmpeg_path,
-            })
-        ]
-        for ydl_opts in methods:
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    if not info:
-                        continue
-                    if 'entries' in info:
-                        entries = [e for e in info['entries'] if e is not None]
-                        valid_entries = []
-                        for entry in entries:
-                            if self.is_valid_entry(entry):
-                                valid_entries.append(entry)
-                        if valid_entries:
-                            info['entries'] = valid_entries
-                            return info
-                    elif info.get('_type') == 'video' or 'title' in info:
-                        return {
-                            'title': f"Single Video: {info.get('title', 'Unknown')}",
-                            'entries': [info],
-                            '_type': 'playlist',
-                            'playlist_count': 1
-                        }
-                    elif 'channel' in url.lower() or '/@' in url:
-                        res = self.handle_channel_url(url, ydl_opts)
-                        if res: return res
-            except Exception:
-                continue
-        return self.fallback_playlist_extraction(url)
+            },
+        }[name]
+        if limit:
+            options['playlistend'] = limit
+        return options
+
+    def _extract_with_options(self, url, ydl_opts):
+        with ydl_session(ydl_opts) as ydl:
+            count_extractor_call()
+            info = ydl.extract_info(url, download=False)
+            if not info:
+                return None
+            if 'entries' in info:
+                entries = [e for e in info['entries'] if e is not None]
+                valid_entries = []
+                for entry in entries:
+                    if self.is_valid_entry(entry):
+                        valid_entries.append(entry)
+                if valid_entries:
+                    info['entries'] = valid_entries
+                    return info
+            elif info.get('_type') == 'video' or 'title' in info:
+                return {
+                    'title': f"Single Video: {info.get('title', 'Unknown')}",
+                    'entries': [info],
+                    '_type': 'playlist',
+                    'playlist_count': 1
+                }
+        return None
+
+    def iter_playlist_pages(self, url, limit=None, page_size=STREAM_PAGE_SIZE):
+        """Yield (playlist_info, entries) pages of validated entries while the playlist is enumerated.
+
+        playlist_info is the playlist metadata without 'entries' and is the same
+        dict for every page. yt-dlp fetches continuation pages lazily, so the first
+        page arrives long before a large channel is fully listed. Falls back to
+        get_playlist_info (one page) if the URL cannot be streamed.
+        """
+        url = self.preprocess_playlist_url(url)
+        opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': 'in_playlist',
+            'ignoreerrors': True,
+            'ffmpeg_location': self.ffmpeg_path,
+        }
+        yielded = False
+        try:
+            with ydl_session(opts) as ydl:
+                info = None
+                target = url
+                for _ in range(MAX_REDIRECTS + 1):
+                    count_extractor_call()
+                    info = ydl.extract_info(target, download=False, process=False)
+                    if not info or info.get('_type') not in ('url', 'url_transparent') or not info.get('url'):
+                        break
+                    target = info['url']
+                entries = info.get('entries') if info else None
+                if entries is not None:
+                    meta = {k: v for k, v in info.items() if k != 'entries'}
+                    meta['_type'] = 'playlist'
+                    page = []
+                    for entry in (itertools.islice(entries, limit) if limit else entries):
+                        if self.is_valid_entry(entry):
+                            page.append(entry)
+                        if len(page) >= page_size:
+                            yielded = True
+                            yield meta, page
+                            page = []
+                    if page:
+                        yielded = True
+                        yield meta, page
+        except Exception:
+            if yielded:
+                return  # Keep what was listed rather than starting over
+        if not yielded:
+            info = self.get_playlist_info(url, limit)
+            if isinstance(info, dict) and info.get('entries'):
+                meta = {k: v for k, v in info.items() if k != 'entries'}
+                yield meta, list(info['entries'])
+
+    def playlist_from_partial(self, info, limit=None):
+        """Build playlist info from an unprocessed extract_info result without another network call."""
+        entries = info.get('entries')
+        if entries is None:
+            return None
+        try:
+            entries = list(itertools.islice(entries, limit) if limit else entries)
+        except Exception:
+            return None
+        valid_entries = [e for e in entries if self.is_valid_entry(e)]
+        if not valid_entries:
+            return None
+        playlist = {k: v for k, v in info.items() if k != 'entries'}
+        playlist['entries'] = valid_entries
+        playlist['_type'] = 'playlist'
+        return playlist
 
     def preprocess_playlist_url(self, url):
         if '&list=' in url and 'watch?v=' in url:
@@ -88,25 +232,38 @@ class PlaylistExtractor:
                 if playlist_id.startswith('RD'):
                     return url
                 return f"https://www.youtube.com/playlist?list={playlist_id}"
-        if '/channel/' in url or '/@' in url or '/c/' in url:
+        if '/channel/' in url or '/@' in url or '/c/' in url or '/user/' in url:
             return self.convert_channel_to_playlist(url)
         return url
 
     def convert_channel_to_playlist(self, url):
+        # /channel/UC... URLs carry the ID; handles and custom URLs are resolved once and cached
+        channel_id = channel_id_from_url(url)
+        key = channel_name_key(url) if not channel_id else None
+        if key:
+            channel_id = self.channel_ids.get(key)
+        if not channel_id:
+            channel_id = self.resolve_channel_id(url)
+            if channel_id and key:
+                self.channel_ids.put(key, channel_id)
+        uploads_id = uploads_playlist_id(channel_id)
+        if uploads_id:
+            return f"https://www.youtube.com/playlist?list={uploads_id}"
+        return url
+
+    def resolve_channel_id(self, url):
         try:
             opts = {'quiet': True, 'no_warnings': True}
             if os.path.exists(self.ffmpeg_path):
                 opts['ffmpeg_location'] = self.ffmpeg_path
-            with yt_dlp.YoutubeDL(opts) as ydl:
+            with ydl_session(opts) as ydl:
+                count_extractor_call()
                 info = ydl.extract_info(url, download=False, process=False)
                 if info and 'channel_id' in info:
-                    channel_id = info['channel_id']
-                    if channel_id.startswith('UC'):
-                        uploads_id = 'UU' + channel_id[2:]
-                        return f"https://www.youtube.com/playlist?list={uploads_id}"
+                    return info['channel_id']
         except:
             pass
-        return url
+        return None
 
     def is_valid_entry(self, entry):
         if not entry or not isinstance(entry, dict):
@@ -123,7 +280,8 @@ class PlaylistExtractor:
         try:
             channel_opts = ydl_opts.copy()
             channel_opts['playlistend'] = 100
-            with yt_dlp.YoutubeDL(channel_opts) as ydl:
+            with ydl_session(channel_opts) as ydl:
+                count_extractor_call()
                 info = ydl.extract_info(url, download=False)
                 if info and 'entries' in info:
                     entries = [e for e in info['entries'] if self.is_valid_entry(e)]
@@ -147,7 +305,8 @@ class PlaylistExtractor:
                 'playlistend': 50,
                 'ffmpeg_location': self.ffmpeg_path,
             }
-            with yt_dlp.YoutubeDL(simple_opts) as ydl:
+            with ydl_session(simple_opts) as ydl:
+                count_extractor_call()
                 info = ydl.extract_info(url, download=False)
                 if info:
                     if 'entries' in info:
@@ -0,0 +1,172 @@
+import time
+import threading
+from .utils import format_bytes
+
+PROGRESS_INTERVAL = 0.1   # At most 10 progress reports per second per tracker
+
+STARTING = 'starting'
+DOWNLOADING = 'downloading'
+PROCESSING = 'processing'   # streams downloaded, merging / converting
+FINISHED = 'finished'
+ERROR = 'error'
+
+
+def format_eta(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+class ProgressEvent:
+    """Numeric progress of one job, or of several jobs summed up by ProgressTracker.
+
+    fraction is 0..1, or None while the total size is unknown. For aggregate
+    events done/count/active describe the batch (finished, total and running jobs).
+    """
+    __slots__ = ('job', 'stage', 'downloaded', 'total', 'speed', 'eta', 'fraction', 'title', 'done', 'count', 'active')
+
+    def __init__(self, job=None, stage=STARTING, downloaded=0, total=None, speed=None, eta=None,
+                 fraction=None, title=None, done=None, count=None, active=0):
+        self.job = job
+        self.stage = stage
+        self.downloaded = downloaded
+        self.total = total
+        self.speed = speed
+        self.eta = eta
+        self.fraction = fraction
+        self.title = title
+        self.done = done
+        self.count = count
+        self.active = active
+
+    @classmethod
+    def from_ytdlp(cls, job, d, title=None):
+        """Build an event from a yt-dlp progress hook dict, using only its numeric fields."""
+        status = d.get('status')
+        stage = PROCESSING if status == 'finished' else ERROR if status == 'error' else DOWNLOADING
+        downloaded = d.get('downloaded_bytes') or 0
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        fraction = None
+        if stage == PROCESSING:
+            fraction = 1.0
+        elif total:
+            fraction = min(1.0, downloaded / total)
+        elif d.get('fragment_count'):
+            fraction = min(1.0, (d.get('fragment_index') or 0) / d['fragment_count'])
+        return cls(job, stage, downloaded, total, d.get('speed'), d.get('eta'), fraction, title)
+
+    @property
+    def percent(self):
+        return 100.0 * self.fraction if self.fraction is not None else 0.0
+
+    def describe(self):
+        """Human readable status line."""
+        speed = f"{format_bytes(self.speed)}/s" if self.speed else None
+        if self.count is not None and self.count > 1:
+            prefix = f"[{self.done}/{self.count}]"
+            if self.stage == FINISHED:
+                return f"{prefix} Finished."
+            if self.active == 1 and self.title:
+                text = f"{prefix} Downloading: {self.title[:30]}..."
+            else:
+                text = f"{prefix} {self.active} downloads active"
+            return f"{text} at {speed}" if speed else text
+        if self.stage == STARTING:
+            return f"Starting download: {self.title}" if self.title else "Starting download..."
+        if self.stage == PROCESSING:
+            return "Processing completed. Finalizing..."
+        if self.stage == FINISHED:
+            return "Done"
+        if self.stage == ERROR:
+            return "Error"
+        parts = [f"{self.percent:.1f}%"]
+        if self.total:
+            parts.append(f"of {format_bytes(self.total)}")
+        if speed:
+            parts.append(f"at {speed}")
+        if self.eta is not None:
+            parts.append(f"ETA {format_eta(self.eta)}")
+        return ' '.join(parts)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"ProgressEvent(job={self.job!r}, stage={self.stage!r}, percent={self.percent:.1f})"
+
+
+class ProgressTracker:
+    """Coalesces yt-dlp progress from any number of concurrent jobs into rate-limited reports.
+
+    callback(event) receives the job's own event while one job is tracked, and a
+    summed event over all jobs otherwise. Stage changes and job start/finish are
+    reported immediately; byte counts at most once per interval, however many
+    hook calls yt-dlp makes.
+    """
+
+    def __init__(self, callback, count=1, interval=PROGRESS_INTERVAL):
+        self.callback = callback
+        self.count = count
+        self.interval = interval
+        self.done = 0
+        self.active = {}  # job -> latest ProgressEvent
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+
+    def start(self, job, title=None):
+        with self._lock:
+            self.active[job] = ProgressEvent(job, STARTING, title=title)
+            self._report_locked(True)
+
+    def hook(self, job):
+        """yt-dlp progress hook feeding this tracker for job."""
+        def progress_hook(d):
+            self.update(job, d)
+        return progress_hook
+
+    def update(self, job, d):
+        with self._lock:
+            previous = self.active.get(job)
+            if previous is None:
+                return
+            event = ProgressEvent.from_ytdlp(job, d, previous.title)
+            self.active[job] = event
+            self._report_locked(event.stage != previous.stage)
+
+    def finish(self, job):
+        with self._lock:
+            if self.active.pop(job, None) is not None:
+                self.done += 1
+            self._report_locked(True)
+
+    def snapshot(self):
+        with self._lock:
+            return self._aggregate_locked()
+
+    def _report_locked(self, force):
+        now = time.monotonic()
+        if not force and now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        self.callback(self._aggregate_locked())
+
+    def _aggregate_locked(self):
+        if self.count <= 1:
+            if self.active:
+                return next(iter(self.active.values()))
+            return ProgressEvent(stage=FINISHED, fraction=1.0, done=self.done, count=self.count)
+        return combine_events(self.active.values(), self.done, self.count)
+
+
+def combine_events(events, done=0, count=None):
+    """Sum the progress of concurrent jobs; count defaults to done + running jobs."""
+    events = list(events)
+    count = count if count is not None else done + len(events)
+    partial = sum(e.fraction or 0.0 for e in events)
+    fraction = min(1.0, (done + partial) / count) if count else 1.0
+    speed = sum(e.speed or 0 for e in events)
+    total = sum(e.total or 0 for e in events)
+    downloaded = sum(e.downloaded or 0 for e in events)
+    eta = int((total - downloaded) / speed) if speed and total > downloaded else None
+    title = events[0].title if len(events) == 1 else None
+    return ProgressEvent(None, DOWNLOADING if events else FINISHED, downloaded, total or None, speed, eta,
+                         fraction, title, done, count, len(events))
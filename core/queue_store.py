@@ -0,0 +1,150 @@
+import os
+import json
+import sqlite3
+import threading
+from .utils import get_data_dir
+
+# Fields kept from analysis results; stream URLs and headers expire, so they are dropped
+INFO_FIELDS = ('id', 'title', 'webpage_url', 'original_url', 'uploader', 'uploader_id', 'channel', 'channel_id',
+               'duration', 'thumbnail', 'extractor_key', '_type', 'playlist_count')
+FORMAT_FIELDS = ('format_id', 'ext', 'height', 'width', 'fps', 'vcodec', 'acodec', 'tbr', 'vbr', 'abr', 'asr',
+                 'filesize', 'protocol')
+ENTRY_FIELDS = ('id', 'title', 'url', 'duration', 'uploader', 'uploader_id', 'channel', 'thumbnail', 'ie_key')
+DESCRIPTION_CHARS = 300
+
+
+def _thumbnail(info):
+    if info.get('thumbnail'):
+        return info['thumbnail']
+    thumbnails = info.get('thumbnails') or []
+    return thumbnails[-1].get('url') if thumbnails and isinstance(thumbnails[-1], dict) else None
+
+
+def decode_info(text):
+    """Analysis result stored by QueueStore.save(), or None."""
+    try:
+        return json.loads(text) if text else None
+    except ValueError:
+        return None
+
+
+def compact_info(info):
+    """Strip an analysis result down to what the queue needs to display and plan a download.
+
+    The result is marked with '_compact' so the downloader knows it cannot be
+    downloaded from directly and extracts fresh stream URLs instead.
+    """
+    if not info:
+        return None
+    compact = {key: info[key] for key in INFO_FIELDS if info.get(key) is not None}
+    compact['thumbnail'] = _thumbnail(info)
+    compact['_compact'] = True
+    if info.get('description'):
+        compact['description'] = info['description'][:DESCRIPTION_CHARS]
+    if info.get('formats'):
+        compact['formats'] = [{key: f[key] for key in FORMAT_FIELDS if f.get(key) is not None} for f in info['formats']]
+    if info.get('entries') is not None:
+        entries = []
+        for entry in info['entries']:
+            if isinstance(entry, dict):
+                item = {key: entry[key] for key in ENTRY_FIELDS if entry.get(key) is not None}
+                item['thumbnail'] = _thumbnail(entry)
+                entries.append(item)
+        compact['entries'] = entries
+    return compact
+
+
+class QueueStore:
+    """SQLite copy of the download queue: URLs, order, state, chosen format and compact analysis results.
+
+    save() upserts only the rows it is given and leaves a row's analysis
+    result untouched when it is passed as None, so progress and state changes
+    never rewrite large playlist results. load() returns rows in queue order
+    with the analysis result still JSON encoded; decode_info() it when needed,
+    so restoring thousands of items does not parse every playlist up front.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_data_dir(), 'queue.sqlite')
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    id INTEGER PRIMARY KEY,
+                    position INTEGER NOT NULL,
+                    url TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    status_text TEXT,
+                    title TEXT,
+                    url_type TEXT,
+                    format_choice TEXT,
+                    info TEXT
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def load(self):
+        """[{id, position, url, state, status_text, title, url_type, format_choice, info_json}] in queue order."""
+        with self._lock:
+            rows = self._connect().execute("""
+                SELECT id, position, url, state, status_text, title, url_type, format_choice, info
+                FROM items ORDER BY position
+            """).fetchall()
+        return [{
+            'id': row[0], 'position': row[1], 'url': row[2], 'state': row[3], 'status_text': row[4],
+            'title': row[5], 'url_type': row[6], 'format_choice': row[7], 'info_json': row[8],
+        } for row in rows]
+
+    def next_id(self):
+        with self._lock:
+            # Positions are swapped between rows, so a new row must be past both
+            row = self._connect().execute("SELECT MAX(MAX(id), MAX(position)) FROM items").fetchone()
+        return (row[0] or 0) + 1
+
+    def save(self, items):
+        """Insert or update items; an item without an 'info' analysis result keeps the stored one."""
+        if not items:
+            return
+        rows = [(item['id'], item['position'], item['url'], item['state'], item.get('status_text'),
+                 item.get('title'), item.get('url_type'), item.get('format_choice'),
+                 json.dumps(item['info'], separators=(',', ':')) if item.get('info') is not None else None)
+                for item in items]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("""
+                INSERT INTO items (id, position, url, state, status_text, title, url_type, format_choice, info)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    position = excluded.position, url = excluded.url, state = excluded.state,
+                    status_text = excluded.status_text, title = excluded.title, url_type = excluded.url_type,
+                    format_choice = excluded.format_choice, info = COALESCE(excluded.info, items.info)
+            """, rows)
+            conn.commit()
+
+    def remove(self, ids):
+        ids = list(ids)
+        if not ids:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("DELETE FROM items WHERE id = ?", [(item_id,) for item_id in ids])
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM items")
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,226 @@
+import os
+import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .utils import make_http_session, load_json, atomic_write_json
+
+MIN_SEGMENT_SIZE = 2 * 1024 ** 2   # Files smaller than connections * this use fewer connections
+CHUNK_SIZE = 64 * 1024
+SEGMENT_RETRIES = 3
+STATE_INTERVAL = 1.0   # Seconds between saves of the per-range progress sidecar
+CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+)')
+
+
+class SegmentedDownloadError(Exception):
+    """The server cannot serve this file in ranges, or the assembled file is incomplete."""
+
+
+class SegmentedDownloader:
+    """Fetches one known-length file over several HTTP Range connections.
+
+    The file is preallocated as <path>.segmented.part and each connection
+    writes its own byte range in place, so nothing has to be joined afterwards.
+    The name differs from yt-dlp's <path>.part on purpose: a preallocated file
+    full of holes must never be taken for a resumable yt-dlp partial. How far
+    each range got is saved to a <path>.segmented.json sidecar, so an
+    interrupted download resumes its ranges. The file is only renamed to
+    path once every range is complete and the size matches.
+
+    Progress is reported to yt-dlp style progress hooks, one call at a time,
+    so hooks that sleep (the bandwidth governor) slow down every connection
+    of the download and exceptions they raise (cancellation) abort it.
+    """
+
+    def __init__(self, connections=4, timeout=20):
+        self.connections = max(1, int(connections))
+        self.timeout = timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self):
+        with self._session_lock:
+            if self._session is None:
+                self._session = make_http_session(self.connections)
+            return self._session
+
+    def probe(self, url, headers=None):
+        """Total size of url if the server honours Range requests, else None."""
+        response = self._get_session().get(url, headers={**(headers or {}), 'Range': 'bytes=0-0'},
+                                           stream=True, timeout=self.timeout)
+        try:
+            if response.status_code != 206:
+                return None
+            match = CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+            return int(match.group(3)) if match else None
+        finally:
+            response.close()
+
+    def plan_segments(self, total):
+        """[(start, end)] inclusive byte ranges, one per connection."""
+        count = max(1, min(self.connections, total // MIN_SEGMENT_SIZE))
+        size = -(-total // count)
+        return [(start, min(start + size, total) - 1) for start in range(0, total, size)]
+
+    @staticmethod
+    def temp_paths(path):
+        """(partial file, range sidecar) used while downloading to path."""
+        return path + '.segmented.part', path + '.segmented.json'
+
+    def discard(self, path):
+        """Remove the partial file and sidecar of a segmented download of path."""
+        for temp_path in self.temp_paths(path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def _resume_state(self, part_path, state_path, total):
+        """(segments, received) saved by an interrupted download of the same file, or None."""
+        state = load_json(state_path)
+        try:
+            segments = [(int(start), int(end)) for start, end in state['segments']]
+            received = [max(0, min(int(n), end - start + 1)) for n, (start, end) in zip(state['received'], segments)]
+            if state['total'] == total and len(received) == len(segments) and os.path.getsize(part_path) == total:
+                return segments, received
+        except (OSError, KeyError, TypeError, ValueError):
+            pass
+        return None
+
+    def download(self, url, path, headers=None, total=None, progress_hooks=None):
+        """Download url to path. Raises SegmentedDownloadError if ranged download is not possible.
+
+        On SegmentedDownloadError or any other failure the partial file is kept
+        for a later resume; call discard(path) before fetching path another way.
+        """
+        if not total:
+            total = self.probe(url, headers)
+        if not total:
+            raise SegmentedDownloadError("Server does not support range requests")
+        part_path, state_path = self.temp_paths(path)
+        resumed = self._resume_state(part_path, state_path, total)
+        if resumed:
+            segments, received = resumed
+        else:
+            segments = self.plan_segments(total)
+            received = [0] * len(segments)
+            with open(part_path, 'wb') as f:
+                f.truncate(total)
+        failed = threading.Event()
+        report_lock = threading.Lock()
+        started = time.monotonic()
+        resumed_bytes = sum(received)
+        last_state = [0.0]
+
+        def save_state():
+            # Ranges are written unbuffered, so the counts never run ahead of the file
+            atomic_write_json(state_path, {'total': total, 'segments': segments, 'received': received})
+
+        def report(index, nbytes):
+            with report_lock:
+                received[index] += nbytes
+                downloaded = sum(received)
+                if time.monotonic() - last_state[0] >= STATE_INTERVAL:
+                    last_state[0] = time.monotonic()
+                    save_state()
+                elapsed = time.monotonic() - started
+                speed = (downloaded - resumed_bytes) / elapsed if elapsed > 0 else None
+                status = {
+                    'status': 'downloading',
+                    'downloaded_bytes': downloaded,
+                    'total_bytes': total,
+                    'speed': speed,
+                    'eta': int((total - downloaded) / speed) if speed else None,
+                    'elapsed': elapsed,
+                    'filename': path,
+                    'tmpfilename': part_path,
+                }
+                try:
+                    for hook in progress_hooks or []:
+                        hook(status)
+                except BaseException as e:
+                    # Cancellation from a hook stops every connection and is re-raised as is
+                    hook_errors.append(e)
+                    failed.set()
+                    raise
+
+        def fetch(index):
+            start, end = segments[index]
+            attempts = 0
+            with open(part_path, 'r+b', buffering=0) as f:
+                while start + received[index] <= end and not failed.is_set():
+                    offset = start + received[index]
+                    try:
+                        self._fetch_range(url, headers, offset, end, f, lambda n: report(index, n), failed)
+                    except SegmentedDownloadError:
+                        failed.set()
+                        raise
+                    except Exception:
+                        if failed.is_set():
+                            return
+                    if start + received[index] > offset:
+                        attempts = 0
+                        continue
+                    # Connection dropped without progress; back off and resume the range
+                    attempts += 1
+                    if attempts > SEGMENT_RETRIES:
+                        failed.set()
+                        raise SegmentedDownloadError(f"Segment {index} stalled at byte {offset}")
+                    time.sleep(attempts)
+
+        hook_errors = []
+        try:
+            with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix='segment') as pool:
+                futures = [pool.submit(fetch, index) for index in range(len(segments))]
+                errors = []
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors.append(e)
+            if hook_errors or errors:
+                raise (hook_errors or errors)[0]
+            size = os.path.getsize(part_path)
+            if sum(received) != total or size != total:
+                raise SegmentedDownloadError(f"Incomplete download: {sum(received)} of {total} bytes")
+            os.replace(part_path, path)
+        except BaseException:
+            with report_lock:
+                save_state()
+            raise
+        try:
+            os.remove(state_path)
+        except OSError:
+            pass
+        for hook in progress_hooks or []:
+            hook({'status': 'finished', 'downloaded_bytes': total, 'total_bytes': total,
+                  'elapsed': time.monotonic() - started, 'filename': path})
+        return True
+
+    def _fetch_range(self, url, headers, offset, end, f, on_data, failed):
+        response = self._get_session().get(url, headers={**(headers or {}), 'Range': f'bytes={offset}-{end}'},
+                                           stream=True, timeout=self.timeout)
+        try:
+            if response.status_code != 206:
+                raise SegmentedDownloadError(f"Range request answered with HTTP {response.status_code}")
+            match = CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+            if not match or int(match.group(1)) != offset:
+                raise SegmentedDownloadError("Server returned a different range than requested")
+            f.seek(offset)
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if failed.is_set():
+                    return
+                chunk = memoryview(chunk)[:end + 1 - offset]
+                written = 0
+                while written < len(chunk):  # Unbuffered writes may be short
+                    written += f.write(chunk[written:])
+                offset += len(chunk)
+                on_data(len(chunk))
+                if offset > end:
+                    return
+        finally:
+            response.close()
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
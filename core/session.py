@@ -0,0 +1,101 @@
+import json
+import atexit
+import threading
+from contextlib import contextmanager
+
+# Options that change on every call and are applied to a pooled instance at checkout
+PER_CALL_OPTIONS = ('outtmpl', 'progress_hooks', 'match_filter')
+MAX_IDLE_PER_KEY = 4
+
+
+class YDLSessionPool:
+    """Pool of warm YoutubeDL instances shared by all core operations.
+
+    Instances are grouped by their options (ignoring PER_CALL_OPTIONS), so a
+    checkout only ever gets an instance built with compatible settings. Each
+    instance keeps its HTTP connections, cookie jar and initialised extractors
+    between calls. A checked-out instance belongs to one thread until it is
+    released, which makes the pool safe to use from concurrent workers.
+    """
+
+    def __init__(self, max_idle=MAX_IDLE_PER_KEY):
+        self.max_idle = max_idle
+        self.created = 0
+        self.reused = 0
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _key(self, opts):
+        shared = {k: v for k, v in opts.items() if k not in PER_CALL_OPTIONS}
+        return json.dumps(shared, sort_keys=True, default=repr)
+
+    def _acquire(self, key, opts):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop()
+            self.created += 1
+        import yt_dlp  # Deferred: loading the extractor registry dominates startup time
+        shared = {k: v for k, v in opts.items() if k not in PER_CALL_OPTIONS}
+        return yt_dlp.YoutubeDL(shared)
+
+    def _prepare(self, ydl, opts):
+        hooks = list(opts.get('progress_hooks') or [])
+        ydl.params['progress_hooks'] = hooks
+        ydl._progress_hooks = hooks
+        ydl.params['match_filter'] = opts.get('match_filter')
+        ydl.params['outtmpl'] = {'default': opts['outtmpl']} if opts.get('outtmpl') else {}
+        if hasattr(ydl, '_parse_outtmpl'):
+            ydl._parse_outtmpl()
+        # Per-run bookkeeping that would otherwise leak between checkouts
+        ydl._download_retcode = 0
+        ydl._num_downloads = 0
+
+    def _release(self, key, ydl):
+        ydl.params['progress_hooks'] = []
+        ydl._progress_hooks = []
+        ydl.params['match_filter'] = None
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(ydl)
+                return
+        self._close(ydl)
+
+    def _close(self, ydl):
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def session(self, opts):
+        key = self._key(opts)
+        ydl = self._acquire(key, opts)
+        self._prepare(ydl, opts)
+        try:
+            yield ydl
+        finally:
+            self._release(key, ydl)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for instances in idle.values():
+            for ydl in instances:
+                self._close(ydl)
+
+    def stats(self):
+        with self._lock:
+            idle = sum(len(v) for v in self._idle.values())
+        return {'created': self.created, 'reused': self.reused, 'idle': idle}
+
+
+default_pool = YDLSessionPool()
+atexit.register(default_pool.close)
+
+
+def ydl_session(opts):
+    """Check out a pooled YoutubeDL configured with opts, for use in a with-statement."""
+    return default_pool.session(opts)
@@ -0,0 +1,115 @@
+import os
+import re
+import threading
+from .utils import get_data_dir, load_json, atomic_write_json
+
+URL_CLASSES = ('mix', 'uploads', 'playlist', 'channel', 'other')
+DECAY = 0.2             # Weight of the newest attempt in the decayed averages
+MIN_ATTEMPTS = 3        # Attempts before a strategy is ranked by its own record
+PRIOR_SECONDS = 2.0     # Assumed latency of the first default strategy; later ones cost more
+MIN_SUCCESS_RATE = 0.05 # Keeps the cost of a strategy that always fails finite
+
+
+def classify_playlist_url(url):
+    """URL class used to pick an extraction strategy: mix (RD), uploads (UU), playlist, channel or other."""
+    match = re.search(r'[?&]list=([^&]+)', url or '')
+    if match:
+        list_id = match.group(1)
+        if list_id.startswith('RD'):
+            return 'mix'
+        if list_id.startswith('UU'):
+            return 'uploads'
+        return 'playlist'
+    if any(part in (url or '') for part in ('/channel/', '/@', '/c/', '/user/')):
+        return 'channel'
+    return 'other'
+
+
+class StrategyMemory:
+    """Per URL class success and latency statistics for playlist extraction strategies.
+
+    rank() orders strategies by expected cost: average latency divided by
+    success rate, so a method that fails half the time counts as twice as slow.
+    Both averages are exponentially decayed (DECAY is the weight of the newest
+    attempt) and start from a prior that reproduces the default order, cheapest
+    first. A strategy keeps its prior cost until it has MIN_ATTEMPTS attempts,
+    so one transient failure cannot promote a slow method for a whole URL class.
+    Statistics are kept in a small JSON file in the app cache directory.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_data_dir(), 'strategies.json')
+        self._lock = threading.Lock()
+        self._stats = self._load()
+
+    def _load(self):
+        return load_json(self.path)
+
+    def _save_locked(self):
+        atomic_write_json(self.path, self._stats)
+
+    @staticmethod
+    def _prior(position):
+        return {'success_avg': 1.0, 'seconds_avg': PRIOR_SECONDS * (position + 1)}
+
+    @staticmethod
+    def _averages(stats, position):
+        if 'success_avg' in stats:
+            return stats['success_avg'], stats['seconds_avg']
+        if stats.get('attempts'):
+            # Written before decayed averages were kept
+            return stats['successes'] / stats['attempts'], stats['total_seconds'] / stats['attempts']
+        prior = StrategyMemory._prior(position)
+        return prior['success_avg'], prior['seconds_avg']
+
+    def record(self, url_class, strategy, success, seconds, position=0):
+        """Add one attempt; position is the strategy's place in the default order (its prior)."""
+        with self._lock:
+            stats = self._stats.setdefault(url_class, {}).setdefault(
+                strategy, {'attempts': 0, 'successes': 0, 'total_seconds': 0.0})
+            success_avg, seconds_avg = self._averages(stats, position)
+            stats['success_avg'] = (1 - DECAY) * success_avg + DECAY * (1.0 if success else 0.0)
+            stats['seconds_avg'] = (1 - DECAY) * seconds_avg + DECAY * seconds
+            stats['attempts'] += 1
+            stats['successes'] += 1 if success else 0
+            stats['total_seconds'] += seconds
+            self._save_locked()
+
+    def rank(self, url_class, strategies):
+        """Return strategies cheapest-first by expected cost; untried ones keep the default order."""
+        with self._lock:
+            known = self._stats.get(url_class, {})
+
+            def cost(item):
+                position, name = item
+                stats = known.get(name, {})
+                if stats.get('attempts', 0) < MIN_ATTEMPTS:
+                    prior = self._prior(position)
+                    return (prior['seconds_avg'] / prior['success_avg'], position)
+                success_avg, seconds_avg = self._averages(stats, position)
+                return (seconds_avg / max(success_avg, MIN_SUCCESS_RATE), position)
+
+            return [name for _, name in sorted(enumerate(strategies), key=cost)]
+
+    def stats(self):
+        """{url_class: {strategy: {attempts, successes, success_rate, avg_seconds, recent_success_rate, recent_seconds}}}"""
+        with self._lock:
+            return {
+                url_class: {
+                    name: {
+                        'attempts': s['attempts'],
+                        'successes': s['successes'],
+                        'success_rate': s['successes'] / s['attempts'] if s['attempts'] else 0.0,
+                        'avg_seconds': s['total_seconds'] / s['attempts'] if s['attempts'] else 0.0,
+                        'recent_success_rate': self._averages(s, 0)[0],
+                        'recent_seconds': self._averages(s, 0)[1],
+                    }
+                    for name, s in strategies.items()
+                }
+                for url_class, strategies in self._stats.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._stats = {}
+            self._save_locked()
@@ -0,0 +1,127 @@
+import os
+import time
+import sqlite3
+import threading
+from .utils import get_data_dir
+from .strategy import classify_playlist_url
+
+STOP_AFTER_KNOWN = 5   # Consecutive already-seen entries that end a newest-first enumeration
+
+
+class PlaylistSync:
+    """Snapshot of the entry IDs seen per playlist, for incremental re-checks.
+
+    fetch_new() streams the playlist and, for newest-first lists (channel
+    uploads), stops enumerating once it runs into entries it has seen before,
+    so a daily re-check costs one page instead of the whole channel. Entries
+    only count as seen after mark_seen(), so a failed download near the
+    top of the list is offered again on the next sync.
+    """
+
+    def __init__(self, extractor, path=None):
+        self.extractor = extractor
+        self.path = path or os.path.join(get_data_dir(), 'sync.sqlite')
+        self._lock = threading.Lock()
+        self._conn = None
+        self._known = {}   # playlist key -> set of video IDs
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen (
+                    playlist TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    first_seen REAL NOT NULL,
+                    PRIMARY KEY (playlist, video_id)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS playlists (
+                    playlist TEXT PRIMARY KEY,
+                    url TEXT,
+                    title TEXT,
+                    last_sync REAL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def known_ids(self, key):
+        with self._lock:
+            known = self._known.get(key)
+            if known is None:
+                rows = self._connect().execute("SELECT video_id FROM seen WHERE playlist = ?", (key,))
+                known = self._known[key] = {row[0] for row in rows}
+            return known
+
+    def fetch_new(self, url, limit=None, newest_first=None):
+        """Return (key, playlist_info) where playlist_info['entries'] holds only unseen entries.
+
+        key identifies the playlist for mark_seen(). playlist_info is None if the
+        playlist could not be listed.
+        """
+        if newest_first is None:
+            newest_first = classify_playlist_url(url) in ('uploads', 'channel')
+        pages = self.extractor.iter_playlist_pages(url, limit)
+        meta = key = known = None
+        new_entries = []
+        streak = 0
+        try:
+            for meta, page in pages:
+                if key is None:
+                    key = meta.get('id') or url
+                    known = self.known_ids(key)
+                for entry in page:
+                    if entry.get('id') in known:
+                        streak += 1
+                        if newest_first and streak >= STOP_AFTER_KNOWN:
+                            break
+                    else:
+                        streak = 0
+                        new_entries.append(entry)
+                else:
+                    continue
+                break  # Reached the part of the list seen last time
+        finally:
+            pages.close()
+        if meta is None:
+            return None, None
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO playlists VALUES (?, ?, ?, ?)",
+                         (key, url, meta.get('title'), time.time()))
+            conn.commit()
+        info = dict(meta, entries=new_entries)
+        info['_type'] = 'playlist'
+        return key, info
+
+    def mark_seen(self, key, video_ids):
+        video_ids = [video_id for video_id in video_ids if video_id]
+        if not video_ids:
+            return
+        now = time.time()
+        known = self.known_ids(key)
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?, ?)", [(key, video_id, now) for video_id in video_ids])
+            conn.commit()
+            known.update(video_ids)
+
+    def forget(self, key):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM seen WHERE playlist = ?", (key,))
+            conn.execute("DELETE FROM playlists WHERE playlist = ?", (key,))
+            conn.commit()
+            self._known.pop(key, None)
+
+    def playlists(self):
+        """[{playlist, url, title, last_sync, seen}] for every synced playlist."""
+        with self._lock:
+            rows = self._connect().execute("""
+                SELECT p.playlist, p.url, p.title, p.last_sync, COUNT(s.video_id)
+                FROM playlists p LEFT JOIN seen s ON s.playlist = p.playlist
+                GROUP BY p.playlist
+            """).fetchall()
+        return [{'playlist': r[0], 'url': r[1], 'title': r[2], 'last_sync': r[3], 'seen': r[4]} for r in rows]
@@ -1,20 +1,144 @@
 import os
 import subprocess
 import re
+import json
 import shutil
-import yt_dlp
+import threading
+import functools
+from urllib.parse import urlsplit
+from .session import ydl_session
+
+DATA_DIR = '.ytd-cache'
+DATA_DIR_ENV = 'YTD_DATA_DIR'   # Overrides the cache/state directory, e.g. for benchmarks
+
+VIDEO_ID_PATTERNS = [
+    r'[?&]v=([0-9A-Za-z_-]{11})(?:[&#]|$)',
+    r'/(?:shorts|live|embed|v)/([0-9A-Za-z_-]{11})(?:[/?&#]|$)',
+    r'youtu\.be/([0-9A-Za-z_-]{11})(?:[/?&#]|$)',
+]
+# Only URLs on these hosts (or their subdomains) carry YouTube video IDs
+YOUTUBE_HOSTS = ('youtube.com', 'youtu.be', 'youtube-nocookie.com')
+
+_extractor_calls = threading.local()
+
+class ExtractorCallCounter:
+    """Extractor invocations made by one thread and any helper threads it hands the counter to."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self, n=1):
+        with self._lock:
+            self.count += n
+
+def get_extractor_counter():
+    """The counter of the current thread, created on first use."""
+    counter = getattr(_extractor_calls, 'counter', None)
+    if counter is None:
+        counter = _extractor_calls.counter = ExtractorCallCounter()
+    return counter
+
+def use_extractor_counter(counter):
+    """Make the current (helper) thread count its calls into another thread's counter."""
+    _extractor_calls.counter = counter
+
+def count_extractor_call():
+    """Record one yt-dlp extractor invocation on the current thread."""
+    get_extractor_counter().add()
+
+def get_extractor_call_count():
+    """Number of extractor invocations made so far on the current thread and its helpers."""
+    return get_extractor_counter().count
 
 def get_script_dir():
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+def get_data_dir():
+    """Get the application-level cache directory (metadata, state), creating it if needed."""
+    path = os.environ.get(DATA_DIR_ENV) or os.path.join(get_script_dir(), DATA_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def load_json(path):
+    """Dict stored at path by atomic_write_json(); {} if the file is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def atomic_write_json(path, data, fsync=False):
+    """Write data to a temporary file and rename it over path, so readers never see half a file.
+
+    With fsync the data is forced to disk before the rename, so the new file
+    also survives a power loss. Returns False if the write failed; callers
+    treat their JSON stores as best effort.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return True
+    except Exception:
+        return False
+
+def make_http_session(pool_size=4):
+    """requests.Session whose connection pool allows pool_size concurrent requests per host.
+
+    requests is imported here, on first use, to keep startup cheap.
+    """
+    import requests
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=max(pool_size, 4))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def is_youtube_url(url):
+    """True if url is on a YouTube host; a missing scheme is allowed."""
+    try:
+        host = (urlsplit(url if '//' in url else '//' + url).hostname or '').lower()
+    except ValueError:
+        return False
+    return any(host == name or host.endswith('.' + name) for name in YOUTUBE_HOSTS)
+
+def extract_video_id(url):
+    """Return the 11-character video ID of a YouTube URL, or None for other URLs and URLs without one.
+
+    Other sites' IDs are never returned, so they cannot hit ID-keyed cache or archive entries.
+    """
+    if not url or not is_youtube_url(url):
+        return None
+    for pattern in VIDEO_ID_PATTERNS:
+        match = re.search(pattern, url)
+        if match:
+            return match.group(1)
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _which_ffmpeg():
+    return shutil.which('ffmpeg')
+
 def get_ffmpeg_path():
-    """Get ffmpeg full path from system PATH. Cross-platform."""
-    path = shutil.which('ffmpeg')
+    """Get ffmpeg full path from system PATH. Cross-platform. The PATH lookup is cached."""
+    path = _which_ffmpeg()
     return path if path else 'ffmpeg'
 
 def check_ffmpeg():
     """Check if ffmpeg is available in system PATH. Returns True if found."""
-    return shutil.which('ffmpeg') is not None
+    return _which_ffmpeg() is not None
+
+def format_bytes(num_bytes):
+    for unit in ['B', 'KiB', 'MiB', 'GiB']:
+        if num_bytes < 1024 or unit == 'GiB':
+            return f"{num_bytes:.2f}{unit}"
+        num_bytes /= 1024
 
 def sanitize_filename(filename):
     filename = re.sub(r'[<>:"/\\|?*]', '', filename)
@@ -22,13 +146,20 @@ def sanitize_filename(filename):
     filename = filename.strip('. ')
     return filename[:200]
 
-def detect_url_type(url):
+def classify_url(url):
+    """Classify a URL from its shape alone. Returns 'playlist', 'video', 'channel' or None."""
     if any(x in url.lower() for x in ['playlist', 'list=', '&list=']):
         return 'playlist'
     elif any(x in url.lower() for x in ['watch?v=', 'youtu.be/', '/watch/']):
         return 'video'
-    elif any(x in url.lower() for x in ['channel/', '/c/', '/@']):
+    elif any(x in url.lower() for x in ['channel/', '/c/', '/@', '/user/']):
         return 'channel'
+    return None
+
+def detect_url_type(url):
+    url_type = classify_url(url)
+    if url_type:
+        return url_type
     else:
         try:
             opts = {'quiet': True, 'no_warnings': True}
@@ -36,7 +167,8 @@ def detect_url_type(url):
             if os.path.exists(ffmpeg_path):
                 opts['ffmpeg_location'] = ffmpeg_path
                 
-            with yt_dlp.YoutubeDL(opts) as ydl:
+            with ydl_session(opts) as ydl:
+                count_extractor_call()
                 info = ydl.extract_info(url, download=False, process=False)
                 if info.get('_type') == 'playlist':
                     return 'playlist'
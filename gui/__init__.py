@@ -1,4 +1,12 @@
-from .main_window import MediaDownloaderGUI
-from .settings import SettingsManager
-
 __all__ = ['MediaDownloaderGUI', 'SettingsManager']
+
+
+def __getattr__(name):
+    # Resolved on first access so importing the package stays cheap
+    if name == 'MediaDownloaderGUI':
+        from .main_window import MediaDownloaderGUI
+        return MediaDownloaderGUI
+    if name == 'SettingsManager':
+        from .settings import SettingsManager
+        return SettingsManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,27 @@
 import os
-from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
+import time
+from collections import deque
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLineEdit, QLabel, 
-                             QComboBox, QMessageBox,
-                             QGroupBox, QListWidget, QListWidgetItem, QFileDialog, QStackedWidget)
-from PySide6.QtCore import Qt
+                             QComboBox, QMessageBox, QCheckBox,
+                             QGroupBox, QListView, QFileDialog, QStackedWidget)
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont, QColor, QPalette
 
 from core import YouTubeDownloaderCore
+from core.utils import format_bytes
+from core.bandwidth import parse_rate
+from core.queue_store import QueueStore, compact_info
 from .settings import SettingsManager
-from .threads import ImageLoader, AnalyzeThread, DownloadThread
+from .threads import AnalyzeThread, DownloadThread
+from .thumbnails import ThumbnailService
 from .components import GradientButton
-from .queue_ui import QueueItemWidget
+from .queue_ui import QueueModel, QueueItemDelegate, ENTRY_ROLE
+from .playlist_ui import PlaylistModel, DURATION_FILTERS
+from .scheduler import DownloadScheduler, QueueEntry, ItemState
+
+
+SHUTDOWN_WAIT_SECONDS = 5   # Longest time closing the window waits for running jobs
 
 
 class MediaDownloaderGUI(QMainWindow):
@@ -20,16 +31,39 @@ class MediaDownloaderGUI(QMainWindow):
         self.settings = SettingsManager()
         self.current_info = None
         self.current_type = None
-        self.queue_active = False
         
-        self.analysis_queue = []
-        self.is_analyzing_bg = False
+        self.queue_model = QueueModel(self)
+        self.analysis_queue = deque()
+        self.analysis_in_flight = {} # url -> queue entries waiting on that extraction
+        self.analysis_partial = {} # url -> playlist info growing while it is enumerated
         self.active_threads = set() # Track running threads to prevent GC
+        self.thumbnails = ThumbnailService(parent=self)
+        self.thumbnails.ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_url = None
+        
+        self.scheduler = DownloadScheduler(self.queue_entries, self.create_queue_download, self.get_download_slots(), self)
+        self.scheduler.entry_changed.connect(self.on_entry_changed)
+        self.scheduler.progress_changed.connect(self.on_queue_progress)
+        self.scheduler.queue_finished.connect(lambda: self.queue_panel.setTitle("Queue"))
+        
+        # Queue changes are written to disk in batches, at most once a second
+        self.queue_store = QueueStore()
+        self.queue_dirty = set()
+        self.queue_removed = set()
+        self.queue_save_timer = QTimer(self)
+        self.queue_save_timer.setSingleShot(True)
+        self.queue_save_timer.setInterval(1000)
+        self.queue_save_timer.timeout.connect(self.save_queue)
+        self.download_thread = None
+        self.analyze_thread = None
+        self.shut_down = False
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
         
         self.setWindowTitle("YT Downloader")
         self.setMinimumSize(1000, 700)
         self.setup_ui()
         self.setup_dark_theme()
+        self.queue_restored = False
         
         missing = self.core.check_executable_paths()
         if missing:
@@ -92,6 +126,16 @@ class MediaDownloaderGUI(QMainWindow):
         self.limit_combo.setStyleSheet("QComboBox { background-color: #2b2b2b; color: #fff; border: 1px solid #444; padding: 5px; }")
         config_layout.addWidget(self.limit_combo)
 
+        config_layout.addWidget(QLabel("Parallel:"))
+        self.workers_combo = QComboBox()
+        self.workers_combo.setFixedWidth(50)
+        self.workers_combo.addItems(["1", "2", "3", "4", "6", "8"])
+        self.workers_combo.setToolTip("Playlist videos downloaded at the same time")
+        self.workers_combo.setCurrentText(str(self.settings.get("playlist_workers")))
+        self.workers_combo.setStyleSheet("QComboBox { background-color: #2b2b2b; color: #fff; border: 1px solid #444; padding: 5px; }")
+        self.workers_combo.currentTextChanged.connect(lambda text: self.settings.set("playlist_workers", text))
+        config_layout.addWidget(self.workers_combo)
+
         # Default Preferences
         config_layout.addSpacing(20)
         config_layout.addWidget(QLabel("Default:"))
@@ -164,6 +208,10 @@ class MediaDownloaderGUI(QMainWindow):
         fmt_row.addWidget(self.format_combo)
         opts_layout.addLayout(fmt_row)
         
+        # Skips the download archive check for this download only
+        self.redownload_chk = QCheckBox("Re-download even if already downloaded")
+        opts_layout.addWidget(self.redownload_chk)
+        
         opts_group.setLayout(opts_layout)
         right_layout.addWidget(opts_group)
         
@@ -184,9 +232,27 @@ class MediaDownloaderGUI(QMainWindow):
         list_controls.addWidget(self.btn_invert)
         playlist_layout.addLayout(list_controls)
         
-        self.playlist_widget = QListWidget()
-        self.playlist_widget.setStyleSheet("QListWidget { background-color: #2b2b2b; color: white; border: 1px solid #444; padding: 5px; } QListWidget::item { padding: 5px; }")
-        playlist_layout.addWidget(self.playlist_widget)
+        filter_row = QHBoxLayout()
+        self.playlist_filter = QLineEdit()
+        self.playlist_filter.setPlaceholderText("Filter by title...")
+        self.playlist_filter.setStyleSheet("QLineEdit { background-color: #2b2b2b; color: #fff; border: 1px solid #444; padding: 5px; }")
+        self.playlist_filter.textChanged.connect(self.apply_playlist_filter)
+        filter_row.addWidget(self.playlist_filter, stretch=1)
+        
+        self.duration_filter = QComboBox()
+        self.duration_filter.addItems([label for label, _, _ in DURATION_FILTERS])
+        self.duration_filter.setStyleSheet("QComboBox { background-color: #2b2b2b; color: #fff; border: 1px solid #444; padding: 5px; }")
+        self.duration_filter.currentIndexChanged.connect(self.apply_playlist_filter)
+        filter_row.addWidget(self.duration_filter)
+        playlist_layout.addLayout(filter_row)
+        
+        self.playlist_model = PlaylistModel(self)
+        self.playlist_model.selection_changed.connect(self.on_playlist_selection_changed)
+        self.playlist_view = QListView()
+        self.playlist_view.setModel(self.playlist_model)
+        self.playlist_view.setUniformItemSizes(True)
+        self.playlist_view.setStyleSheet("QListView { background-color: #2b2b2b; color: white; border: 1px solid #444; padding: 5px; } QListView::item { padding: 5px; }")
+        playlist_layout.addWidget(self.playlist_view)
         
         self.playlist_group.setLayout(playlist_layout)
         self.playlist_group.setVisible(False)
@@ -218,30 +284,67 @@ class MediaDownloaderGUI(QMainWindow):
         center_layout.addWidget(self.left_stack, stretch=6)
         
         # Queue Panel
-        queue_panel = QGroupBox("Queue")
+        self.queue_panel = queue_panel = QGroupBox("Queue")
         # Removed setFixedWidth to allow flexible sizing or use stretch
         queue_panel.setMinimumWidth(320)
         queue_panel.setMaximumWidth(400)
         queue_layout = QVBoxLayout()
         queue_layout.setContentsMargins(10, 15, 10, 10)
         
-        self.queue_list = QListWidget()
-        self.queue_list.setStyleSheet("""
-            QListWidget {
+        self.queue_view = QListView()
+        self.queue_view.setStyleSheet("""
+            QListView {
                 background-color: #1e1e1e;
                 border: 1px solid #333;
                 border-radius: 6px;
-            }
-            QListWidget::item {
-                background: transparent;
-                margin-bottom: 5px;
+                padding: 4px;
             }
         """)
-        self.queue_list.setVerticalScrollMode(QListWidget.ScrollPerPixel)
-        self.queue_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.queue_list.setSpacing(4)
-        self.queue_list.itemClicked.connect(self.on_queue_item_clicked)
-        queue_layout.addWidget(self.queue_list)
+        self.queue_delegate = QueueItemDelegate(self.queue_view)
+        self.queue_delegate.move_up.connect(lambda row: self.move_queue_item(row, -1))
+        self.queue_delegate.move_down.connect(lambda row: self.move_queue_item(row, 1))
+        self.queue_delegate.remove.connect(self.remove_queue_item)
+        self.queue_view.setModel(self.queue_model)
+        self.queue_view.setItemDelegate(self.queue_delegate)
+        self.queue_view.setUniformItemSizes(True) # Lets the view lay out 10k rows without asking each one
+        self.queue_view.setMouseTracking(True)
+        self.queue_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.queue_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.queue_view.clicked.connect(self.on_queue_item_clicked)
+        queue_layout.addWidget(self.queue_view)
+        
+        queue_controls = QHBoxLayout()
+        queue_controls.addWidget(QLabel("Slots:"))
+        self.slots_combo = QComboBox()
+        self.slots_combo.setFixedWidth(50)
+        self.slots_combo.addItems(["1", "2", "3", "4", "6", "8"])
+        self.slots_combo.setToolTip("Queue items downloaded at the same time")
+        self.slots_combo.setCurrentText(str(self.settings.get("download_slots")))
+        self.slots_combo.setStyleSheet("QComboBox { background-color: #2b2b2b; color: #fff; border: 1px solid #444; padding: 5px; }")
+        self.slots_combo.currentTextChanged.connect(self.on_slots_changed)
+        queue_controls.addWidget(self.slots_combo)
+        
+        queue_controls.addWidget(QLabel("Conn:"))
+        self.connections_combo = QComboBox()
+        self.connections_combo.setFixedWidth(50)
+        self.connections_combo.addItems(["1", "2", "4", "8"])
+        self.connections_combo.setToolTip("HTTP connections per single-file download; splits the file into ranges fetched in parallel")
+        self.connections_combo.setCurrentText(str(self.settings.get("segment_connections")))
+        self.connections_combo.setStyleSheet("QComboBox { background-color: #2b2b2b; color: #fff; border: 1px solid #444; padding: 5px; }")
+        self.connections_combo.currentTextChanged.connect(self.on_connections_changed)
+        queue_controls.addWidget(self.connections_combo)
+        self.core.set_segment_connections(self.get_segment_connections())
+        
+        queue_controls.addWidget(QLabel("Limit:"))
+        self.bandwidth_combo = QComboBox()
+        self.bandwidth_combo.addItems(["Unlimited", "512K", "1M", "2M", "5M", "10M", "20M", "50M"])
+        self.bandwidth_combo.setToolTip("Combined speed of all downloads, per second; changes apply to running downloads")
+        self.bandwidth_combo.setCurrentText(str(self.settings.get("bandwidth_limit")))
+        self.bandwidth_combo.setStyleSheet("QComboBox { background-color: #2b2b2b; color: #fff; border: 1px solid #444; padding: 5px; }")
+        self.bandwidth_combo.currentTextChanged.connect(self.on_bandwidth_changed)
+        queue_controls.addWidget(self.bandwidth_combo, stretch=1)
+        queue_layout.addLayout(queue_controls)
+        self.apply_bandwidth_limit(self.bandwidth_combo.currentText())
         
         self.queue_start_btn = GradientButton("Process Queue")
         self.queue_start_btn.clicked.connect(self.process_queue)
@@ -300,16 +403,24 @@ class MediaDownloaderGUI(QMainWindow):
         if new_path and os.path.exists(new_path):
             self.settings.set("download_dir", new_path)
             
+    def get_playlist_workers(self):
+        try:
+            return max(1, int(self.workers_combo.currentText()))
+        except ValueError:
+            return 1
+
     def select_all_items(self):
-        for i in range(self.playlist_widget.count()):
-            item = self.playlist_widget.item(i)
-            item.setCheckState(Qt.Checked)
+        self.playlist_model.set_visible_checked(True)
 
     def invert_selection(self):
-        for i in range(self.playlist_widget.count()):
-            item = self.playlist_widget.item(i)
-            current = item.checkState()
-            item.setCheckState(Qt.Unchecked if current == Qt.Checked else Qt.Checked)
+        self.playlist_model.invert_visible()
+
+    def apply_playlist_filter(self):
+        _, min_duration, max_duration = DURATION_FILTERS[max(0, self.duration_filter.currentIndex())]
+        self.playlist_model.set_filter(self.playlist_filter.text(), min_duration, max_duration)
+
+    def on_playlist_selection_changed(self, checked, total):
+        self.playlist_group.setTitle(f"Select Videos ({checked}/{total})")
 
     def start_analyze(self):
         url = self.url_input.text().strip()
@@ -344,8 +455,7 @@ class MediaDownloaderGUI(QMainWindow):
         title = info.get('title', 'Unknown')
         
         if url_type == 'playlist':
-            count = len(info.get('entries', []))
-            self.info_label.setText(f"📂 Playlist: {title}\n📊 Items: {count} videos detected")
+            self.show_playlist_summary(info)
             self.playlist_group.setVisible(True)
             self.populate_playlist_list(info.get('entries', []))
         else:
@@ -358,30 +468,35 @@ class MediaDownloaderGUI(QMainWindow):
             self.playlist_group.setVisible(False)
             
         thumb_url = info.get('thumbnail')
+        thumb_id = info.get('id')
         if not thumb_url and url_type == 'playlist':
             entries = info.get('entries', [])
             if entries:
                 first_entry = entries[0]
                 if isinstance(first_entry, dict):
                     thumb_url = first_entry.get('thumbnail')
+                    thumb_id = first_entry.get('id')
 
+        self.thumbnail_url = thumb_url
         if thumb_url:
-            loader = ImageLoader(thumb_url)
-            self.active_threads.add(loader)
-            loader.finished.connect(self.set_thumbnail)
-            loader.finished.connect(lambda: self.cleanup_thread(loader))
-            loader.start()
+            pixmap = self.thumbnails.get(thumb_url, thumb_id, self.thumbnail_label.size())
+            if pixmap is not None:
+                self.set_thumbnail(pixmap)
+            else:
+                self.thumbnail_label.setText("Loading...")
         else:
             self.thumbnail_label.setText("No Thumbnail")
             
         self.left_stack.setCurrentIndex(1) # Show content
         self.update_options()
 
+    def show_playlist_summary(self, info, loading=False):
+        title = info.get('title', 'Unknown')
+        count = len(info.get('entries', []))
+        more = " so far, still loading..." if loading else " detected"
+        self.info_label.setText(f"📂 Playlist: {title}\n📊 Items: {count} videos{more}")
+
     def on_analyze_finished(self, info, url_type):
-        if self.queue_active and getattr(self, 'current_queue_item', None):
-            self.process_queue_download(info, url_type)
-            return
-            
         self.analyze_btn.setEnabled(True)
         self.analyze_btn.setText("Analyze")
         
@@ -391,19 +506,17 @@ class MediaDownloaderGUI(QMainWindow):
         self.download_btn.setEnabled(True)
         self.download_btn.setText("START DOWNLOAD")
         
+    def on_thumbnail_ready(self, url, pixmap):
+        # Ignore thumbnails of items that are no longer displayed
+        if url == self.thumbnail_url:
+            self.set_thumbnail(pixmap)
+
     def set_thumbnail(self, pixmap):
-        scaled = pixmap.scaled(self.thumbnail_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.thumbnail_label.setPixmap(scaled)
+        # Already scaled to the label size by the thumbnail service
+        self.thumbnail_label.setPixmap(pixmap)
 
     def populate_playlist_list(self, entries):
-        self.playlist_widget.clear()
-        for i, entry in enumerate(entries, 1):
-            if not entry: continue
-            title = entry.get('title', f"Video {i}")
-            item = QListWidgetItem(f"{i}. {title}")
-            item.setCheckState(Qt.Checked)
-            item.setData(Qt.UserRole, i-1)
-            self.playlist_widget.addItem(item)
+        self.playlist_model.set_entries(entries)
             
     def on_analyze_error(self, error_msg):
         self.analyze_btn.setEnabled(True)
@@ -465,7 +578,8 @@ class MediaDownloaderGUI(QMainWindow):
 
         data = {
             'is_audio': is_audio,
-            'format': target_format
+            'format': target_format,
+            'force': self.redownload_chk.isChecked()
         }
         
         if self.current_type == 'video':
@@ -473,6 +587,7 @@ class MediaDownloaderGUI(QMainWindow):
             data['title'] = self.current_info.get('title', 'video')
             data['channel'] = self.current_info.get('uploader')
             data['channel_id'] = self.current_info.get('uploader_id')
+            data['info'] = self.current_info
             if not is_audio:
                 idx = self.quality_combo.currentIndex()
                 if idx >= 0:
@@ -486,17 +601,14 @@ class MediaDownloaderGUI(QMainWindow):
             data['info'] = self.current_info
             data['media_type'] = 'audio' if is_audio else 'video'
             
-            selected_indices = []
-            for i in range(self.playlist_widget.count()):
-                item = self.playlist_widget.item(i)
-                if item.checkState() == Qt.Checked:
-                    selected_indices.append(item.data(Qt.UserRole))
+            selected_indices = self.playlist_model.selected_indices()
             
             if not selected_indices:
                 QMessageBox.warning(self, "Warning", "No videos selected in playlist!")
                 return
                 
             data['selected_indices'] = selected_indices
+            data['concurrency'] = self.get_playlist_workers()
             
             if not is_audio:
                 q_text = self.quality_combo.currentText()
@@ -517,22 +629,13 @@ class MediaDownloaderGUI(QMainWindow):
         self.download_thread.finished.connect(self.on_download_finished)
         self.download_thread.start()
         
-    def update_progress(self, percent, text):
+    def update_progress(self, event):
         pass
 
     def on_download_finished(self, success, msg):
-        if self.queue_active and getattr(self, 'current_queue_item', None):
-            status = "Done" if success else "Failed"
-            if getattr(self, 'current_queue_widget', None):
-                 self.current_queue_widget.set_status(status, 100 if success else 0)
-            
-            self.queue_active = False
-            self.current_queue_item = None
-            self.check_queue_processing()
-            return
-
         self.download_btn.setEnabled(True)
         self.download_btn.setText("START DOWNLOAD")
+        self.redownload_chk.setChecked(False)
         if success:
             QMessageBox.information(self, "Success", msg)
         else:
@@ -540,88 +643,202 @@ class MediaDownloaderGUI(QMainWindow):
 
     # QUEUE LOGIC ------------------------
     
+    def get_download_slots(self):
+        try:
+            return max(1, int(self.settings.get("download_slots")))
+        except (TypeError, ValueError):
+            return 1
+
+    def on_slots_changed(self, text):
+        self.settings.set("download_slots", text)
+        self.scheduler.set_slots(self.get_download_slots())
+
+    def get_segment_connections(self):
+        try:
+            return max(1, int(self.settings.get("segment_connections")))
+        except (TypeError, ValueError):
+            return 1
+
+    def on_connections_changed(self, text):
+        self.settings.set("segment_connections", text)
+        self.core.set_segment_connections(self.get_segment_connections())
+
+    def on_bandwidth_changed(self, text):
+        self.settings.set("bandwidth_limit", text)
+        self.apply_bandwidth_limit(text)
+
+    def apply_bandwidth_limit(self, text):
+        try:
+            limit = 0 if text == "Unlimited" else parse_rate(text)
+        except ValueError:
+            limit = 0
+        self.core.set_bandwidth_limit(limit)
+
+    def queue_entries(self):
+        return self.queue_model.entries
+
     def process_queue(self):
-        self.check_queue_processing()
+        # Failed items get another try each time the queue is started
+        for entry in self.queue_entries():
+            if entry.state == ItemState.FAILED and entry.info:
+                self.scheduler.update(entry, ItemState.READY)
+        self.scheduler.start()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.queue_restored:
+            # Queued behind the first frame, so restoring and the analyses it starts never delay it
+            QTimer.singleShot(0, self.restore_queue)
+
+    def restore_queue(self):
+        """Rebuild the queue saved by the last session; analysis results are reused, not re-extracted."""
+        if self.queue_restored or self.shut_down:
+            return
+        self.queue_restored = True
+        try:
+            records = self.queue_store.load()
+            self.next_store_id = self.queue_store.next_id()
+        except Exception as e:
+            print(f"Failed to restore queue: {e}")
+            records = []
+            self.next_store_id = 1
+        entries = [QueueEntry.from_record(record) for record in records]
+        self.queue_model.add_entries(entries)
+        self.analysis_queue.extend(entry for entry in entries if entry.state == ItemState.WAITING)
+        self.process_next_analysis()
+
+    def mark_queue_dirty(self, entry):
+        if self.shut_down:
+            return  # Late results of cancelled jobs must not overwrite the saved queue
+        self.queue_dirty.add(entry)
+        if not self.queue_save_timer.isActive():
+            self.queue_save_timer.start()
+
+    def save_queue(self):
+        """Write changed queue entries to the queue store in one transaction."""
+        self.queue_save_timer.stop()
+        records = []
+        for entry in self.queue_dirty:
+            if entry not in self.queue_model:
+                continue
+            record = entry.to_record()
+            # Partial playlist results are saved once the analysis finishes
+            info_changed = entry.info_changed and entry.state != ItemState.ANALYZING
+            if record == entry.saved_record and not info_changed:
+                continue  # Only progress changed
+            entry.saved_record = dict(record)
+            if info_changed:
+                record['info'] = compact_info(entry.info)
+                entry.info_changed = False
+            records.append(record)
+        try:
+            self.queue_store.save(records)
+            self.queue_store.remove(self.queue_removed)
+        except Exception as e:
+            print(f"Failed to save queue: {e}")
+        self.queue_dirty.clear()
+        self.queue_removed.clear()
+
+    def shutdown(self):
+        """Cancel running work, wait for worker threads to stop, then persist the queue and settings."""
+        if self.shut_down:
+            return
+        self.shut_down = True
+        self.scheduler.stop()
+        self.analysis_queue.clear()
+        threads = set(self.active_threads) | set(self.scheduler.active.values())
+        threads.update(t for t in (self.download_thread, self.analyze_thread) if t is not None)
+        for thread in threads:
+            thread.cancel()
+        # Extractions and ffmpeg merges cannot be interrupted; give them a bounded grace period
+        deadline = time.monotonic() + SHUTDOWN_WAIT_SECONDS
+        for thread in threads:
+            thread.wait(max(0, int((deadline - time.monotonic()) * 1000)))
+        self.save_queue()
+        self.settings.flush()
+        self.thumbnails.close()
+
+    def closeEvent(self, event):
+        self.shutdown()
+        super().closeEvent(event)
 
     def add_url_to_queue(self):
         url = self.url_input.text().strip()
         if not url: return
-        item = self.add_queue_item(url)
+        self.restore_queue()  # New items go after the restored ones
+        entry = QueueEntry(url)
+        entry.store_id = entry.position = self.next_store_id
+        self.next_store_id += 1
+        self.queue_model.add_entries([entry])
+        self.mark_queue_dirty(entry)
         self.url_input.clear()
         
         # Trigger background analysis
-        self.analysis_queue.append(item)
+        self.analysis_queue.append(entry)
         self.process_next_analysis()
 
-    def add_queue_item(self, url, status="Waiting..."):
-        item = QListWidgetItem()
-        widget = QueueItemWidget(url)
-        widget.set_status(status)
-        item.setSizeHint(widget.sizeHint())
-        
-        self.queue_list.addItem(item)
-        self.queue_list.setItemWidget(item, widget)
-        
-        widget.move_up.connect(lambda: self.move_queue_item(item, -1))
-        widget.move_down.connect(lambda: self.move_queue_item(item, 1))
-        widget.remove.connect(lambda: self.remove_queue_item(item))
-        return item
+    def on_entry_changed(self, entry):
+        self.queue_model.mark_changed(entry)
+        self.mark_queue_dirty(entry)
 
-    def move_queue_item(self, item, direction):
-        row = self.queue_list.row(item)
-        new_row = row + direction
-        if 0 <= new_row < self.queue_list.count():
-            widget = self.queue_list.itemWidget(item)
-            if widget.status_label.text() != "Pending": return
-            
-            url = widget.url
-            self.queue_list.takeItem(row)
-            self.queue_list.insertItem(new_row, item)
-            
-            new_widget = QueueItemWidget(url)
-            new_widget.set_status("Pending")
-            item.setSizeHint(new_widget.sizeHint())
-            self.queue_list.setItemWidget(item, new_widget)
-            
-            new_widget.move_up.connect(lambda: self.move_queue_item(item, -1))
-            new_widget.move_down.connect(lambda: self.move_queue_item(item, 1))
-            new_widget.remove.connect(lambda: self.remove_queue_item(item))
-            
-            self.queue_list.setCurrentRow(new_row)
-
-    def remove_queue_item(self, item):
-        row = self.queue_list.row(item)
-        self.queue_list.takeItem(row)
+    def on_queue_progress(self, event):
+        if event.active:
+            self.queue_panel.setTitle(f"Queue - {event.active} active, {event.percent:.0f}% at {format_bytes(event.speed or 0)}/s")
+        else:
+            self.queue_panel.setTitle("Queue")
 
-    def check_queue_processing(self):
-        if self.queue_active: return
+    def move_queue_item(self, row, direction):
+        entry = self.queue_model.entry_at(row)
+        if entry is None or not entry.is_movable: return
         
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            widget = self.queue_list.itemWidget(item)
-            if widget.status_label.text() == "Ready" or widget.status_label.text() == "Waiting...":
-                self.start_queue_processing(item, widget)
-                break
-                
+        new_row = row + direction
+        if self.queue_model.move_row(row, new_row):
+            self.queue_view.setCurrentIndex(self.queue_model.index(new_row))
+            # Neighbours trade places, so only their two sort keys change
+            other = self.queue_model.entry_at(row)
+            entry.position, other.position = other.position, entry.position
+            self.mark_queue_dirty(entry)
+            self.mark_queue_dirty(other)
+
+    def remove_queue_item(self, row):
+        entry = self.queue_model.entry_at(row)
+        if entry is None or entry.state == ItemState.DOWNLOADING: return
+        self.queue_model.remove_row(row)
+        self.queue_dirty.discard(entry)
+        self.queue_removed.add(entry.store_id)
+        if not self.queue_save_timer.isActive():
+            self.queue_save_timer.start()
+        self.scheduler.fill_slots()
+
+    def get_analysis_workers(self):
+        try:
+            return max(1, int(self.settings.get("analysis_workers")))
+        except (TypeError, ValueError):
+            return 1
+
     def process_next_analysis(self):
-        if self.is_analyzing_bg: return
-        if not self.analysis_queue: return
-        
-        item = self.analysis_queue[0] # Don't pop yet, wait for finish
-        widget = self.queue_list.itemWidget(item)
-        
-        if not widget: # Item removed?
-            self.analysis_queue.pop(0)
-            self.process_next_analysis()
+        if self.shut_down:
             return
-
-        self.is_analyzing_bg = True
-        widget.set_status("Analyzing...")
+        while self.analysis_queue and len(self.analysis_in_flight) < self.get_analysis_workers():
+            entry = self.analysis_queue.popleft()
+            if entry in self.queue_model and entry.state == ItemState.WAITING: # Item removed?
+                self.start_analysis(entry)
+
+    def start_analysis(self, entry):
+        self.scheduler.update(entry, ItemState.ANALYZING)
+        url = entry.url
+        
+        # The same URL pasted twice is only extracted once
+        if url in self.analysis_in_flight:
+            self.analysis_in_flight[url].append(entry)
+            return
+        self.analysis_in_flight[url] = [entry]
         
-        # Use a separate thread for background analysis
-        thread = AnalyzeThread(self.core, widget.url)
-        thread.finished.connect(lambda i, t: self.on_bg_analyze_finished(item, i, t))
-        thread.error.connect(lambda e: self.on_bg_analyze_error(item, e))
+        # Use a separate thread for background analysis; playlists arrive page by page
+        thread = AnalyzeThread(self.core, url, stream=True)
+        thread.partial.connect(lambda meta, page: self.on_bg_analyze_partial(url, meta, page))
+        thread.finished.connect(lambda i, t: self.on_bg_analyze_finished(url, i, t))
+        thread.error.connect(lambda e: self.on_bg_analyze_error(url, e))
         self.run_thread_safe(thread)
 
     def run_thread_safe(self, thread):
@@ -634,96 +851,74 @@ class MediaDownloaderGUI(QMainWindow):
             self.active_threads.remove(thread)
         thread.deleteLater()
 
-    def on_bg_analyze_finished(self, item, info, url_type):
-        if item in self.analysis_queue:
-            self.analysis_queue.remove(item)
+    def on_bg_analyze_partial(self, url, meta, page):
+        info = self.analysis_partial.get(url)
+        if info is None:
+            info = self.analysis_partial[url] = dict(meta, entries=[])
+        info['entries'].extend(page)
+        for entry in self.analysis_in_flight.get(url, []):
+            entry.info = info
+            entry.url_type = 'playlist'
+            entry.title = info.get('title') or entry.title
+            self.scheduler.update(entry, ItemState.ANALYZING, f"Analyzing... {len(info['entries'])} videos found")
+        
+        # Entries can be browsed and selected while the rest are still listed
+        if self.current_info is info:
+            self.playlist_model.append_entries(page)
+            self.show_playlist_summary(info, loading=True)
+
+    def on_bg_analyze_finished(self, url, info, url_type):
+        partial = self.analysis_partial.pop(url, None)
+        # Results can arrive in any order; they are matched back to entries by URL
+        for entry in self.analysis_in_flight.pop(url, []):
+            entry.info = info
+            entry.url_type = url_type
+            entry.title = info.get('title', 'Unknown')
+            self.scheduler.update(entry, ItemState.READY)
             
-        widget = self.queue_list.itemWidget(item)
-        if widget:
-            title = info.get('title', 'Unknown')
-            widget.set_title(title)
-            widget.set_status("Ready")
-            # Store info in item
-            item.setData(Qt.UserRole, {'info': info, 'type': url_type})
-            
-            # If this is the currently selected item or single item, show it?
-            if self.queue_list.currentItem() == item:
-                self.display_video_info(info, url_type)
+            # If this is the currently selected item, show it
+            if self.queue_view.currentIndex().data(ENTRY_ROLE) is entry:
+                if partial is not None and self.current_info is partial:
+                    # Already listed page by page; keep the user's selection
+                    self.current_info = info
+                    self.show_playlist_summary(info)
+                else:
+                    self.display_video_info(info, url_type)
 
-        self.is_analyzing_bg = False
         self.process_next_analysis()
+        self.scheduler.fill_slots()
 
-    def on_bg_analyze_error(self, item, err):
-        if item in self.analysis_queue:
-            self.analysis_queue.remove(item)
-        widget = self.queue_list.itemWidget(item)
-        if widget:
-            widget.set_status("Analyze Failed")
-        self.is_analyzing_bg = False
+    def on_bg_analyze_error(self, url, err):
+        self.analysis_partial.pop(url, None)
+        for entry in self.analysis_in_flight.pop(url, []):
+            self.scheduler.update(entry, ItemState.ANALYZE_FAILED)
         self.process_next_analysis()
+        self.scheduler.fill_slots()
 
-    def on_queue_item_clicked(self, item):
-        try:
-            if item is None:
-                return
-            
-            # Check if widget still exists
-            widget = self.queue_list.itemWidget(item)
-            if widget is None:
-                return
-            
-            data = item.data(Qt.UserRole)
-            if data and isinstance(data, dict):
-                info = data.get('info')
-                url_type = data.get('type')
-                if info and url_type:
-                    self.display_video_info(info, url_type)
-            else:
-                # Item not yet analyzed, show URL in info label
-                self.left_stack.setCurrentIndex(1)
-                self.thumbnail_label.setText("Analyzing...")
-                self.info_label.setText(f"🔄 Waiting for analysis...\\n\\n📎 {widget.url}")
-                self.playlist_group.setVisible(False)
-        except RuntimeError:
-            # Widget was deleted during click handling
-            pass
-
-    def start_queue_processing(self, item, widget):
-        self.queue_active = True
-        self.current_queue_item = item
-        self.current_queue_widget = widget
-        
-        # Check if already analyzed
-        data = item.data(Qt.UserRole)
-        if data and isinstance(data, dict):
-            # Already has info, skip analyze step
-            self.process_queue_download(data['info'], data['type'])
-        else:
-            # Not analyzed? Wait for BG analyze or Force?
-            # Force analyze now (using main loop)
-            widget.set_status("Analyzing (Active)...", 0)
-            thread = AnalyzeThread(self.core, widget.url)
-            thread.finished.connect(self.on_analyze_finished)
-            thread.error.connect(self.on_queue_error)
-            self.run_thread_safe(thread)
-
-    def on_queue_error(self, err):
-        if getattr(self, 'current_queue_widget', None):
-            self.current_queue_widget.set_status("Error")
-        self.queue_active = False
-        self.current_queue_item = None
-        self.check_queue_processing()
-
-    def process_queue_download(self, info, url_type):
-        if not getattr(self, 'current_queue_widget', None): return
-        
-        # Display Info in Left Panel
-        self.display_video_info(info, url_type)
+    def on_queue_item_clicked(self, index):
+        entry = index.data(ENTRY_ROLE)
+        if entry is None:
+            return
         
-        self.current_queue_widget.set_status("Downloading...", 0)
+        if entry.info and entry.url_type:
+            self.display_video_info(entry.info, entry.url_type)
+            if entry.state == ItemState.ANALYZING:
+                self.show_playlist_summary(entry.info, loading=True)
+        else:
+            # Item not yet analyzed, show URL in info label
+            self.left_stack.setCurrentIndex(1)
+            self.thumbnail_url = None
+            self.thumbnail_label.setText("Analyzing...")
+            self.info_label.setText(f"🔄 Waiting for analysis...\n\n📎 {entry.url}")
+            self.playlist_group.setVisible(False)
+
+    def create_queue_download(self, entry):
+        """Build (but do not start) the DownloadThread for a READY queue entry."""
+        info, url_type = entry.info, entry.url_type
         
-        # Use Default Settings from UI
-        def_setting = self.def_fmt_combo.currentText()
+        # Use Default Settings from UI; the choice is kept with the item for retries and restarts
+        def_setting = entry.format_choice or self.def_fmt_combo.currentText()
+        entry.format_choice = def_setting
         is_audio = "Audio" in def_setting
         
         # "Video (Best)", "Audio (MP3)", "Video (1080p)", "Video (720p)"
@@ -736,7 +931,7 @@ class MediaDownloaderGUI(QMainWindow):
         data = {
             'is_audio': is_audio,
             'format': target_format,
-            'url': info.get('webpage_url', self.current_queue_widget.url),
+            'url': info.get('webpage_url', entry.url),
             'title': info.get('title', 'Unknown'),
             'channel': info.get('uploader'),
             'channel_id': info.get('uploader_id')
@@ -759,22 +954,17 @@ class MediaDownloaderGUI(QMainWindow):
                 else:
                     data['quality'] = options[0][1] # Best available
             
-            thread = DownloadThread(self.core, 'video', data, path)
+            data['info'] = info
+            return DownloadThread(self.core, 'video', data, path)
             
         elif url_type == 'playlist':
             data['info'] = info
             data['media_type'] = 'audio' if is_audio else 'video'
             data['selected_indices'] = [] 
+            data['concurrency'] = self.get_playlist_workers()
             if quality_pref:
                 data['quality'] = {'height': quality_pref}
             else:
                 data['quality'] = None
-            thread = DownloadThread(self.core, 'playlist', data, path)
-
-        thread.progress_update.connect(self.update_queue_progress)
-        thread.finished.connect(self.on_download_finished)
-        self.run_thread_safe(thread)
-
-    def update_queue_progress(self, percent, text):
-        if getattr(self, 'current_queue_widget', None):
-            self.current_queue_widget.set_status(text, percent)
+            return DownloadThread(self.core, 'playlist', data, path)
+        return None
@@ -0,0 +1,151 @@
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex, QTimer
+
+POPULATE_CHUNK = 500      # Entries appended per event-loop turn while populating
+DURATION_FILTERS = [
+    ("Any length", None, None),
+    ("Under 4 min", None, 4 * 60),
+    ("4 - 20 min", 4 * 60, 20 * 60),
+    ("Over 20 min", 20 * 60, None),
+]
+
+
+class PlaylistModel(QAbstractListModel):
+    """Checkable playlist entries, filtered by title and duration.
+
+    Rows are the entries that pass the current filter; check states live in a
+    bytearray indexed by the entry's position in the playlist, so bulk
+    operations touch no Qt objects and emit a single change signal. Large
+    playlists are appended in chunks so the event loop keeps running.
+    """
+    selection_changed = Signal(int, int)  # checked, total
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []        # (playlist index, entry dict)
+        self.source_count = 0    # length of the playlist's entry list, including skipped entries
+        self.titles = []         # lower-cased titles for filtering
+        self.checked = bytearray()
+        self.rows = []           # positions in self.entries that are shown
+        self.loaded = 0          # entries handed to the view so far
+        self.filter_text = ''
+        self.min_duration = None
+        self.max_duration = None
+        self._populate_timer = QTimer(self)
+        self._populate_timer.timeout.connect(self._populate_chunk)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        pos = self.rows[index.row()]
+        playlist_index, entry = self.entries[pos]
+        if role == Qt.DisplayRole:
+            duration = entry.get('duration')
+            length = f"  ({int(duration) // 60}:{int(duration) % 60:02d})" if duration else ""
+            return f"{playlist_index + 1}. {entry.get('title', f'Video {playlist_index + 1}')}{length}"
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.checked[pos] else Qt.Unchecked
+        if role == Qt.UserRole:
+            return playlist_index
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        pos = self.rows[index.row()]
+        self.checked[pos] = 1 if Qt.CheckState(value) == Qt.Checked else 0
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self._emit_selection()
+        return True
+
+    def set_entries(self, entries):
+        """Replace the playlist; every entry starts checked and rows appear chunk by chunk."""
+        self._populate_timer.stop()
+        self.beginResetModel()
+        self.entries = []
+        self.titles = []
+        self.checked = bytearray()
+        self.source_count = 0
+        self.rows = []
+        self.loaded = 0
+        self.endResetModel()
+        self.append_entries(entries)
+
+    def append_entries(self, entries):
+        """Add entries from a playlist that is still being enumerated; new entries start checked."""
+        added = [(i, entry) for i, entry in enumerate(entries, self.source_count) if entry]
+        self.source_count += len(entries)
+        self.entries.extend(added)
+        self.titles.extend(str(entry.get('title') or '').lower() for _, entry in added)
+        self.checked.extend(b'\x01' * len(added))
+        self._emit_selection()
+        if not self._populate_timer.isActive():
+            self._populate_chunk()
+            if self.loaded < len(self.entries):
+                self._populate_timer.start(0)
+
+    def _populate_chunk(self):
+        end = min(self.loaded + POPULATE_CHUNK, len(self.entries))
+        new_rows = [pos for pos in range(self.loaded, end) if self._accepts(pos)]
+        self.loaded = end
+        if new_rows:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self.rows.extend(new_rows)
+            self.endInsertRows()
+        if self.loaded >= len(self.entries):
+            self._populate_timer.stop()
+
+    def _accepts(self, pos):
+        if self.filter_text and self.filter_text not in self.titles[pos]:
+            return False
+        if self.min_duration is None and self.max_duration is None:
+            return True
+        duration = self.entries[pos][1].get('duration')
+        if not duration:
+            return False
+        if self.min_duration is not None and duration < self.min_duration:
+            return False
+        if self.max_duration is not None and duration >= self.max_duration:
+            return False
+        return True
+
+    def set_filter(self, text=None, min_duration=None, max_duration=None):
+        """Show only entries whose title contains text and whose duration is in [min, max)."""
+        self.filter_text = (text or '').strip().lower()
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.beginResetModel()
+        self.rows = [pos for pos in range(self.loaded) if self._accepts(pos)]
+        self.endResetModel()
+
+    def set_visible_checked(self, checked):
+        """Check or uncheck every entry that passes the filter."""
+        value = 1 if checked else 0
+        for pos in self.rows:
+            self.checked[pos] = value
+        self._rows_changed()
+
+    def invert_visible(self):
+        for pos in self.rows:
+            self.checked[pos] ^= 1
+        self._rows_changed()
+
+    def selected_indices(self):
+        """Playlist indices of all checked entries, including ones hidden by the filter."""
+        return [self.entries[pos][0] for pos, flag in enumerate(self.checked) if flag]
+
+    def _rows_changed(self):
+        if self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [Qt.CheckStateRole])
+        self._emit_selection()
+
+    def _emit_selection(self):
+        self.selection_changed.emit(self.checked.count(1), len(self.entries))
@@ -1,128 +1,204 @@
-from PySide6.QtWidgets import (QFrame, QHBoxLayout, QVBoxLayout, QLabel, 
-                             QPushButton, QProgressBar, QWidget)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import (Qt, Signal, QAbstractListModel, QModelIndex, QRect, QRectF,
+                            QSize, QEvent, QTimer)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QLinearGradient, QPen
 
-class QueueItemWidget(QFrame):
-    move_up = Signal()
-    move_down = Signal()
-    remove = Signal()
+ENTRY_ROLE = Qt.UserRole
+FLUSH_INTERVAL_MS = 50   # Entry changes are repainted in one batch at most this often
 
-    def __init__(self, url, parent=None):
+
+class QueueModel(QAbstractListModel):
+    """Queue of QueueEntry objects.
+
+    Keeps an entry -> row index so lookups and adjacent moves are O(1), and
+    coalesces entry changes into a single dataChanged per flush interval.
+    """
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.url = url
-        self.setFixedHeight(95)
-        
-        # Modern Card Style
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #262626;
-                border: 1px solid #333;
-                border-radius: 10px;
-            }
-            QFrame:hover {
-                background-color: #2d2d2d;
-                border: 1px solid #444;
-            }
-            QLabel {
-                background: transparent;
-                border: none;
-                color: #e0e0e0;
-                font-family: 'Segoe UI', sans-serif;
-            }
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.05);
-                border: none;
-                border-radius: 4px;
-                color: #ccc;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #383838;
-                color: #fff;
-            }
-            QPushButton#btn_remove {
-                font-size: 20px;
-                color: #995555;
-            }
-            QPushButton#btn_remove:hover {
-                background-color: #4a2020;
-                color: #ff6b6b;
-            }
-        """)
-        
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(15, 12, 10, 12)
-        main_layout.setSpacing(10)
-        
-        # Left Info Area
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(6)
-        
-        self.title_label = QLabel(url)
-        self.title_label.setStyleSheet("font-size: 13px; font-weight: 600;")
-        self.title_label.setWordWrap(False)
-        self.title_label.setMaximumWidth(220)
-        
-        self.status_label = QLabel("Waiting...")
-        self.status_label.setStyleSheet("color: #888; font-size: 11px;")
-        
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setFixedHeight(6)
-        self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { background-color: #1a1a1a; border-radius: 3px; border: none; }
-            QProgressBar::chunk { 
-                background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #00BCD4, stop:1 #00E5FF); 
-                border-radius: 3px; 
-            }
-        """)
-        self.progress_bar.setVisible(False)
-        
-        info_layout.addWidget(self.title_label)
-        info_layout.addWidget(self.status_label)
-        info_layout.addWidget(self.progress_bar)
-        main_layout.addLayout(info_layout, stretch=1)
-        
-        # Right Button Area
-        btn_widget = QWidget()
-        btn_widget.setFixedWidth(50)
-        btn_layout = QVBoxLayout(btn_widget)
-        btn_layout.setContentsMargins(0, 0, 5, 0)
-        btn_layout.setSpacing(2)
-        btn_widget.setStyleSheet("background: transparent; border: none;")
-        btn_widget.raise_()  # Ensure buttons are on top
-        
-        self.btn_up = QPushButton("▲")
-        self.btn_up.setFixedSize(28, 24)
-        self.btn_up.setCursor(Qt.PointingHandCursor)
-        self.btn_up.clicked.connect(self.move_up.emit)
-        
-        self.btn_rm = QPushButton("×")
-        self.btn_rm.setObjectName("btn_remove")
-        self.btn_rm.setFixedSize(28, 24)
-        self.btn_rm.setCursor(Qt.PointingHandCursor)
-        self.btn_rm.clicked.connect(self.remove.emit)
-        
-        self.btn_down = QPushButton("▼")
-        self.btn_down.setFixedSize(28, 24)
-        self.btn_down.setCursor(Qt.PointingHandCursor)
-        self.btn_down.clicked.connect(self.move_down.emit)
-        
-        btn_layout.addWidget(self.btn_up)
-        btn_layout.addWidget(self.btn_rm)
-        btn_layout.addWidget(self.btn_down)
-        
-        main_layout.addWidget(btn_widget)
-
-    def set_status(self, text, progress=None):
-        self.status_label.setText(text)
-        if progress is not None:
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(int(progress))
+        self.entries = []
+        self._rows = {}
+        self._dirty = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == ENTRY_ROLE:
+            return entry
+        if role == Qt.DisplayRole:
+            return entry.title
+        if role == Qt.ToolTipRole:
+            return entry.url
+        return None
+
+    def __contains__(self, entry):
+        return entry in self._rows
+
+    def entry_at(self, row):
+        return self.entries[row] if 0 <= row < len(self.entries) else None
+
+    def row_of(self, entry):
+        return self._rows.get(entry, -1)
+
+    def add_entries(self, entries):
+        """Append entries with a single insert notification."""
+        if not entries:
+            return
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        for row, entry in enumerate(entries, first):
+            self.entries.append(entry)
+            self._rows[entry] = row
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        if not 0 <= row < len(self.entries):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        entry = self.entries.pop(row)
+        del self._rows[entry]
+        self._dirty.discard(entry)
+        for i in range(row, len(self.entries)):
+            self._rows[self.entries[i]] = i
+        self.endRemoveRows()
+        return entry
+
+    def move_row(self, row, new_row):
+        """Move one entry to new_row; moving by one place is a constant-time swap."""
+        count = len(self.entries)
+        if row == new_row or not (0 <= row < count and 0 <= new_row < count):
+            return False
+        # Qt's destination is the row the entry is inserted *before*
+        destination = new_row + 1 if new_row > row else new_row
+        if not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination):
+            return False
+        if abs(new_row - row) == 1:
+            self.entries[row], self.entries[new_row] = self.entries[new_row], self.entries[row]
         else:
-            self.progress_bar.setVisible(False)
-            
-    def set_title(self, title):
-        self.title_label.setText(title)
+            self.entries.insert(new_row, self.entries.pop(row))
+        for i in range(min(row, new_row), max(row, new_row) + 1):
+            self._rows[self.entries[i]] = i
+        self.endMoveRows()
+        return True
+
+    def mark_changed(self, entry):
+        """Schedule a repaint of entry; bursts of progress updates collapse into one."""
+        if entry in self._rows:
+            self._dirty.add(entry)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+    def flush(self):
+        rows = [self._rows[entry] for entry in self._dirty if entry in self._rows]
+        self._dirty.clear()
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [Qt.DisplayRole])
+
+
+class QueueItemDelegate(QStyledItemDelegate):
+    """Paints a queue entry as a card with title, status, progress bar and ▲ × ▼ buttons."""
+    move_up = Signal(int)
+    move_down = Signal(int)
+    remove = Signal(int)
+
+    CARD_HEIGHT = 95
+    SPACING = 5
+    BUTTON_SIZE = QSize(28, 24)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Segoe UI")
+        self.title_font.setPixelSize(13)
+        self.title_font.setWeight(QFont.DemiBold)
+        self.status_font = QFont("Segoe UI")
+        self.status_font.setPixelSize(11)
+        self.button_font = QFont("Segoe UI")
+        self.button_font.setPixelSize(16)
+        self.button_font.setBold(True)
+        self.remove_font = QFont(self.button_font)
+        self.remove_font.setPixelSize(20)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.CARD_HEIGHT + self.SPACING)
+
+    def _card_rect(self, rect):
+        return QRect(rect.left() + 2, rect.top() + 2, rect.width() - 4, self.CARD_HEIGHT - 4)
+
+    def _button_rects(self, rect):
+        card = self._card_rect(rect)
+        width, height = self.BUTTON_SIZE.width(), self.BUTTON_SIZE.height()
+        left = card.right() - 15 - width
+        top = card.center().y() - (3 * height + 4) // 2
+        return [QRect(left, top + i * (height + 2), width, height) for i in range(3)]
+
+    def paint(self, painter, option, index):
+        if not index.isValid():
+            return
+        entry = index.data(ENTRY_ROLE)
+        if entry is None:
+            return
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        card = self._card_rect(option.rect)
+        hover = bool(option.state & QStyle.State_MouseOver)
+        selected = bool(option.state & QStyle.State_Selected)
+        painter.setBrush(QColor("#2d2d2d" if hover or selected else "#262626"))
+        painter.setPen(QPen(QColor("#00BCD4" if selected else "#444" if hover else "#333"), 1))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        # Left info area
+        text_left = card.left() + 15
+        text_width = self._button_rects(option.rect)[0].left() - 10 - text_left
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#e0e0e0"))
+        title = QFontMetrics(self.title_font).elidedText(entry.title, Qt.ElideRight, text_width)
+        painter.drawText(QRect(text_left, card.top() + 12, text_width, 20), Qt.AlignLeft | Qt.AlignVCenter, title)
+
+        painter.setFont(self.status_font)
+        painter.setPen(QColor("#888"))
+        status = QFontMetrics(self.status_font).elidedText(entry.status_text, Qt.ElideRight, text_width)
+        painter.drawText(QRect(text_left, card.top() + 38, text_width, 18), Qt.AlignLeft | Qt.AlignVCenter, status)
+
+        if entry.progress is not None:
+            bar = QRectF(text_left, card.top() + 66, text_width, 6)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#1a1a1a"))
+            painter.drawRoundedRect(bar, 3, 3)
+            fraction = max(0.0, min(float(entry.progress), 100.0)) / 100
+            if fraction > 0:
+                chunk = QRectF(bar.left(), bar.top(), bar.width() * fraction, bar.height())
+                gradient = QLinearGradient(chunk.topLeft(), chunk.topRight())
+                gradient.setColorAt(0, QColor("#00BCD4"))
+                gradient.setColorAt(1, QColor("#00E5FF"))
+                painter.setBrush(gradient)
+                painter.drawRoundedRect(chunk, 3, 3)
+
+        # Right button area
+        buttons = (("▲", self.button_font, "#ccc"), ("×", self.remove_font, "#995555"), ("▼", self.button_font, "#ccc"))
+        for rect, (label, font, color) in zip(self._button_rects(option.rect), buttons):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(255, 255, 255, 13))
+            painter.drawRoundedRect(QRectF(rect), 4, 4)
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            painter.drawText(rect, Qt.AlignCenter, label)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            pos = event.position().toPoint()
+            for signal, rect in zip((self.move_up, self.remove, self.move_down), self._button_rects(option.rect)):
+                if rect.contains(pos):
+                    signal.emit(index.row())
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,212 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+from core.progress import PROGRESS_INTERVAL, combine_events
+from core.queue_store import decode_info
+
+
+class ItemState:
+    WAITING = 'waiting'                # added, analysis not started
+    ANALYZING = 'analyzing'
+    ANALYZE_FAILED = 'analyze_failed'
+    READY = 'ready'                    # analyzed, can be downloaded
+    DOWNLOADING = 'downloading'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    LABELS = {
+        WAITING: "Waiting...",
+        ANALYZING: "Analyzing...",
+        ANALYZE_FAILED: "Analyze Failed",
+        READY: "Ready",
+        DOWNLOADING: "Downloading...",
+        DONE: "Done",
+        FAILED: "Failed",
+    }
+
+    # Allowed transitions; anything else is a scheduling bug
+    TRANSITIONS = {
+        WAITING: {ANALYZING},
+        ANALYZING: {READY, ANALYZE_FAILED},
+        ANALYZE_FAILED: {ANALYZING},
+        READY: {DOWNLOADING, ANALYZING},
+        DOWNLOADING: {DONE, FAILED},
+        DONE: {READY},
+        FAILED: {READY, ANALYZING},
+    }
+
+
+class QueueEntry:
+    """One URL in the download queue: its state, analysis result and progress."""
+
+    def __init__(self, url):
+        self.url = url
+        self.state = ItemState.WAITING
+        self.title = url
+        self._info = None
+        self._info_json = None  # stored analysis result, decoded on first use
+        self.info_changed = False  # info replaced since it was last saved
+        self.url_type = None
+        self.status_text = ItemState.LABELS[ItemState.WAITING]
+        self.progress = None
+        self.event = None  # latest ProgressEvent while downloading
+        self.format_choice = None  # default format setting the item was last downloaded with
+        self.store_id = None
+        self.position = None  # sort key in the queue store
+        self.saved_record = None
+
+    @property
+    def info(self):
+        if self._info is None and self._info_json:
+            self._info = decode_info(self._info_json)
+            self._info_json = None
+        return self._info
+
+    @info.setter
+    def info(self, info):
+        self._info = info
+        self._info_json = None
+        self.info_changed = True
+
+    @property
+    def is_movable(self):
+        return self.state != ItemState.DOWNLOADING
+
+    def set_state(self, state, status_text=None, progress=None):
+        if state != self.state and state not in ItemState.TRANSITIONS[self.state]:
+            raise ValueError(f"Invalid queue transition {self.state} -> {state}")
+        self.state = state
+        self.status_text = status_text or ItemState.LABELS[state]
+        self.progress = progress
+
+    def to_record(self):
+        """Queue store row without the analysis result; transient states are saved as the state to resume from."""
+        state, status_text = self.state, self.status_text
+        if state == ItemState.DOWNLOADING:
+            # The job journal lets the download resume where it stopped
+            state, status_text = ItemState.READY, ItemState.LABELS[ItemState.READY]
+        elif state == ItemState.ANALYZING:
+            state, status_text = ItemState.WAITING, ItemState.LABELS[ItemState.WAITING]
+        return {
+            'id': self.store_id,
+            'position': self.position,
+            'url': self.url,
+            'state': state,
+            'status_text': status_text,
+            'title': self.title,
+            'url_type': self.url_type,
+            'format_choice': self.format_choice,
+        }
+
+    @classmethod
+    def from_record(cls, record):
+        entry = cls(record['url'])
+        entry.store_id = record['id']
+        entry.position = record['position']
+        entry.title = record['title'] or entry.url
+        entry.url_type = record['url_type']
+        entry.format_choice = record['format_choice']
+        entry._info_json = record['info_json']
+        state = record['state'] if record['state'] in ItemState.LABELS else ItemState.WAITING
+        if state != ItemState.ANALYZE_FAILED and not (entry._info_json and entry.url_type):
+            state = ItemState.WAITING
+        entry.state = state
+        entry.status_text = (record['status_text'] if state == record['state'] else None) or ItemState.LABELS[state]
+        entry.progress = 100 if state == ItemState.DONE else None
+        entry.saved_record = entry.to_record()
+        return entry
+
+
+class DownloadScheduler(QObject):
+    """Runs queued downloads in up to `slots` concurrent slots, backfilling as slots free up.
+
+    Entries are taken in queue order from `entries()`; only READY entries are
+    started. `start_download(entry)` must return an unstarted DownloadThread.
+    """
+    entry_changed = Signal(object)
+    progress_changed = Signal(object)  # ProgressEvent summed over running downloads
+    queue_finished = Signal()
+
+    def __init__(self, entries, start_download, slots=1, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.start_download = start_download
+        self.slots = max(1, slots)
+        self.running = False
+        self.active = {}  # entry -> DownloadThread
+        self._progress_dirty = False
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(int(PROGRESS_INTERVAL * 1000))
+        self._progress_timer.timeout.connect(self._report_progress)
+
+    def set_slots(self, slots):
+        self.slots = max(1, slots)
+        self.fill_slots()
+
+    def start(self):
+        self.running = True
+        self.fill_slots()
+
+    def stop(self):
+        """Stop starting new downloads; running ones finish normally."""
+        self.running = False
+
+    def update(self, entry, state, status_text=None, progress=None):
+        entry.set_state(state, status_text, progress)
+        self.entry_changed.emit(entry)
+
+    def fill_slots(self):
+        if not self.running:
+            return
+        pending = False
+        for entry in self.entries():
+            if len(self.active) >= self.slots:
+                return
+            if entry.state == ItemState.READY:
+                self._launch(entry)
+            elif entry.state in (ItemState.WAITING, ItemState.ANALYZING):
+                pending = True
+        if not self.active and not pending:
+            self.running = False
+            self.queue_finished.emit()
+
+    def _launch(self, entry):
+        thread = self.start_download(entry)
+        if thread is None:
+            self.update(entry, ItemState.DOWNLOADING)
+            self.update(entry, ItemState.FAILED, "Unsupported item")
+            return
+        self.active[entry] = thread
+        entry.event = None
+        self.update(entry, ItemState.DOWNLOADING, progress=0)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+        thread.progress_update.connect(lambda event: self.on_progress(entry, event))
+        thread.finished.connect(lambda success, msg: self.on_finished(entry, success, msg))
+        thread.start()
+
+    def on_progress(self, entry, event):
+        if entry in self.active:
+            entry.event = event
+            entry.status_text = event.describe()
+            entry.progress = event.percent
+            self.entry_changed.emit(entry)
+            self._progress_dirty = True
+
+    def _report_progress(self):
+        # Sums the latest event of every running download; runs on a timer, not per event
+        if not self.active:
+            self._progress_timer.stop()
+        elif self._progress_dirty:
+            self._progress_dirty = False
+            events = [entry.event for entry in self.active if entry.event is not None]
+            self.progress_changed.emit(combine_events(events))
+
+    def on_finished(self, entry, success, msg):
+        thread = self.active.pop(entry, None)
+        if thread is not None:
+            thread.wait()  # finished is emitted at the very end of run()
+            thread.deleteLater()
+        if success:
+            self.update(entry, ItemState.DONE, progress=100)
+        else:
+            self.update(entry, ItemState.FAILED, f"Failed: {msg}", 0)
+        self.fill_slots()
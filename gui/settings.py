@@ -1,38 +1,115 @@
 import os
 import json
+import time
+import atexit
+import threading
+from core.utils import atomic_write_json
+
+SCHEMA_VERSION = 1
+FLUSH_DELAY = 0.5   # Seconds of quiet after the last change before settings are written
+
+# version -> function upgrading a settings dict from that version to the next one.
+# Version 0 is the unversioned file written before schema_version existed; its keys are unchanged.
+MIGRATIONS = {
+    0: lambda settings: settings,
+}
+
 
 class SettingsManager:
+    """Application settings kept in memory and written to disk in the background.
+
+    set() only updates memory and pushes back the deadline of a single
+    background flusher thread, so handlers on the GUI thread never wait for
+    the disk and bursts of changes cost one write. Writes go to a temporary
+    file that replaces settings.json, so a crash mid-write leaves the
+    previous file intact. Pending changes are flushed at exit.
+    """
     DEFAULT_SETTINGS = {
         "download_dir": os.path.join(os.path.expanduser("~"), "Downloads"),
         "last_quality": "Best Quality",
         "last_format": "mp4",
         "last_type": 0,
-        "playlist_limit": "50"
+        "playlist_limit": "50",
+        "playlist_workers": "3",
+        "analysis_workers": "4",
+        "download_slots": "2",
+        "bandwidth_limit": "Unlimited",
+        "segment_connections": "1"
     }
-    
+
     def __init__(self, filename="settings.json"):
         self.filename = filename
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._deadline = None   # time.monotonic() at which pending changes are written
+        self._flusher = None
+        self._dirty = False
         self.settings = self.load()
-        
+        atexit.register(self.flush)
+
     def load(self):
-        if os.path.exists(self.filename):
+        if not os.path.exists(self.filename):
+            return self.DEFAULT_SETTINGS.copy()
+        try:
+            with open(self.filename, 'r') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("settings file does not hold an object")
+        except Exception as e:
+            # Keep the unreadable file for inspection instead of overwriting it with defaults
+            print(f"Failed to load settings, using defaults: {e}")
             try:
-                with open(self.filename, 'r') as f:
-                    return {**self.DEFAULT_SETTINGS, **json.load(f)}
-            except Exception:
-                return self.DEFAULT_SETTINGS.copy()
-        return self.DEFAULT_SETTINGS.copy()
+                os.replace(self.filename, self.filename + '.corrupt')
+            except OSError:
+                pass
+            return self.DEFAULT_SETTINGS.copy()
+        return {**self.DEFAULT_SETTINGS, **self.migrate(data)}
+
+    def migrate(self, data):
+        version = data.pop("schema_version", 0)
+        while isinstance(version, int) and version in MIGRATIONS and version < SCHEMA_VERSION:
+            data = MIGRATIONS[version](data)
+            version += 1
+        return data
 
     def save(self):
-        try:
-            with open(self.filename, 'w') as f:
-                json.dump(self.settings, f, indent=4)
-        except Exception as e:
-            print(f"Failed to save settings: {e}")
+        """Write pending changes now; normally the background flush does this."""
+        self.flush()
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                self._deadline = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                data = {"schema_version": SCHEMA_VERSION, **self.settings}
+            if not atomic_write_json(self.filename, data, fsync=True):
+                print(f"Failed to save settings to {self.filename}")
+                with self._lock:
+                    self._dirty = True  # Retried on the next change or at exit
+
+    def _flush_loop(self):
+        while True:
+            with self._changed:
+                while self._deadline is None or self._deadline > time.monotonic():
+                    self._changed.wait(None if self._deadline is None else self._deadline - time.monotonic())
+            self.flush()
 
     def get(self, key):
-        return self.settings.get(key, self.DEFAULT_SETTINGS.get(key))
+        with self._lock:
+            return self.settings.get(key, self.DEFAULT_SETTINGS.get(key))
 
     def set(self, key, value):
-        self.settings[key] = value
-        self.save()
+        with self._lock:
+            if key in self.settings and self.settings[key] == value:
+                return
+            self.settings[key] = value
+            self._dirty = True
+            # Push back the deadline so a burst of changes is written once
+            self._deadline = time.monotonic() + FLUSH_DELAY
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name='settings-flush', daemon=True)
+                self._flusher.start()
+            self._changed.notify()
@@ -1,66 +1,62 @@
 import os
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from PySide6.QtCore import QThread, Signal
-from PySide6.QtGui import QPixmap, QImage
-
-class ImageLoader(QThread):
-    finished = Signal(QPixmap)
-
-    def __init__(self, url):
-        super().__init__()
-        self.url = url
-
-    def run(self):
-        try:
-            if not self.url:
-                return
-            response = requests.get(self.url, timeout=10)
-            response.raise_for_status()
-            image = QImage()
-            image.loadFromData(response.content)
-            pixmap = QPixmap.fromImage(image)
-            self.finished.emit(pixmap)
-        except Exception:
-            pass
+from core.progress import ProgressTracker
+from core.utils import classify_url, get_extractor_call_count
 
 
 class AnalyzeThread(QThread):
     finished = Signal(dict, str)
+    partial = Signal(dict, list)  # playlist metadata, next page of entries (stream=True only)
     error = Signal(str)
 
-    def __init__(self, core, url, limit=None):
+    def __init__(self, core, url, limit=None, stream=False):
         super().__init__()
         self.core = core
         self.url = url
         self.limit = limit
+        self.stream = stream
+        self.extractor_calls = 0
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop listing a streamed playlist after the current page; single extractions run to the end."""
+        self.cancelled.set()
 
     def run(self):
         try:
-            url_type = self.core.detect_url_type(self.url)
-            if url_type == 'playlist':
-                info = self.core.get_playlist_info(self.url, limit=self.limit)
-                if info:
-                    self.finished.emit(info, 'playlist')
-                else:
-                    self.error.emit("Could not analyze playlist.")
+            if self.stream and classify_url(self.url) in ('playlist', 'channel'):
+                info, url_type = self._stream_playlist(), 'playlist'
+            else:
+                info, url_type, self.extractor_calls = self.core.analyze(self.url, limit=self.limit)
+            if info:
+                self.finished.emit(info, url_type)
+            elif url_type == 'playlist':
+                self.error.emit("Could not analyze playlist.")
             elif url_type == 'video':
-                info = self.core.get_video_info(self.url)
-                if info:
-                    self.finished.emit(info, 'video')
-                else:
-                    self.error.emit("Could not analyze video.")
+                self.error.emit("Could not analyze video.")
             else:
-                info = self.core.get_video_info(self.url)
-                if info:
-                    self.finished.emit(info, 'video')
-                else:
-                    self.error.emit("Unsupported URL or analysis failed.")
+                self.error.emit("Unsupported URL or analysis failed.")
         except Exception as e:
             self.error.emit(str(e))
 
+    def _stream_playlist(self):
+        start = get_extractor_call_count()
+        info = None
+        for meta, page in self.core.stream_playlist(self.url, self.limit):
+            if info is None:
+                info = dict(meta, entries=[])
+            info['entries'].extend(page)
+            self.partial.emit(meta, page)
+            if self.cancelled.is_set():
+                break
+        self.extractor_calls = get_extractor_call_count() - start
+        return info
+
 
 class DownloadThread(QThread):
-    progress_update = Signal(float, str)
+    progress_update = Signal(object)  # core.progress.ProgressEvent, at most ~10 per second
     finished = Signal(bool, str)
 
     def __init__(self, core, task_type, data, download_dir):
@@ -69,58 +65,51 @@ class DownloadThread(QThread):
         self.task_type = task_type
         self.data = data
         self.download_dir = download_dir
+        self.cancelled = threading.Event()
 
-    def progress_hook(self, d):
-        if d['status'] == 'downloading':
-            try:
-                p = d.get('_percent_str', '0%').replace('%', '')
-                percent = float(p)
-                speed = d.get('_speed_str', 'N/A')
-                eta = d.get('_eta_str', 'N/A')
-                if eta == 'N/A' and d.get('eta'):
-                    eta_sec = d.get('eta')
-                    if isinstance(eta_sec, (int, float)):
-                        eta = f"{int(eta_sec)//60}:{int(eta_sec)%60:02d}"
-                total_bytes = d.get('_total_bytes_str') or d.get('_total_bytes_estimate_str', 'N/A')
-                status_text = f"{percent}% of {total_bytes} at {speed} ETA {eta}"
-                self.progress_update.emit(percent, status_text)
-            except Exception:
-                pass
-        elif d['status'] == 'finished':
-            self.progress_update.emit(100, "Processing completed. Finalizing...")
+    def cancel(self):
+        """Abort running downloads at their next progress update; partial data stays journaled for a resume."""
+        self.cancelled.set()
+
+    def cancel_hook(self, d):
+        if self.cancelled.is_set():
+            from yt_dlp.utils import DownloadCancelled
+            raise DownloadCancelled("Download cancelled")
 
     def run(self):
         try:
-            hooks = [self.progress_hook]
-            
             if self.task_type == 'video':
-                self._download_video(hooks)
+                self._download_video()
             elif self.task_type == 'playlist':
-                self._download_playlist(hooks)
+                self._download_playlist()
         except Exception as e:
             self.finished.emit(False, str(e))
 
-    def _download_video(self, hooks):
+    def _download_video(self):
         url = self.data['url']
         selected_quality = self.data.get('quality')
         target_format = self.data['format']
         title = self.data['title']
         is_audio = self.data['is_audio']
         
-        self.progress_update.emit(0, f"Starting download: {title}")
+        progress = ProgressTracker(self.progress_update.emit)
+        progress.start('video', title)
+        hooks = [progress.hook('video'), self.cancel_hook]
         
         channel = self.data.get('channel')
         channel_id = self.data.get('channel_id')
+        info = self.data.get('info')
+        force = self.data.get('force', False)
         
         if is_audio:
-            success, msg = self.core.download_single_audio(url, target_format, title, self.download_dir, hooks, channel=channel, channel_id=channel_id)
+            success, msg = self.core.download_single_audio(url, target_format, title, self.download_dir, hooks, channel=channel, channel_id=channel_id, info=info, force=force)
         else:
-            success, msg = self.core.download_single_video(url, selected_quality, target_format, title, self.download_dir, hooks, channel=channel, channel_id=channel_id)
+            success, msg = self.core.download_single_video(url, selected_quality, target_format, title, self.download_dir, hooks, channel=channel, channel_id=channel_id, info=info, force=force)
             
-        self.progress_update.emit(100, "Done")
+        progress.finish('video')
         self.finished.emit(success, msg)
 
-    def _download_playlist(self, hooks):
+    def _download_playlist(self):
         playlist_info = self.data['info']
         media_type = self.data['media_type']
         quality = self.data.get('quality')
@@ -150,27 +139,35 @@ class DownloadThread(QThread):
         final_dir = os.path.join(self.download_dir, safe_playlist_name)
         os.makedirs(final_dir, exist_ok=True)
         
-        successful_count = 0
-        
-        for i, entry in enumerate(valid_entries, 1):
+        concurrency = max(1, int(self.data.get('concurrency') or 1))
+        force = self.data.get('force', False)
+        progress = ProgressTracker(self.progress_update.emit, total)
+
+        def download_entry(i, entry):
             title = entry.get('title', f'Video_{i}')
             url = entry.get('_constructed_url')
-            
-            self.progress_update.emit(0, f"[{i}/{total}] Downloading: {title[:30]}...")
+            if self.cancelled.is_set():
+                return False
+            progress.start(i, title)
+            entry_hooks = [progress.hook(i), self.cancel_hook]
             
             channel = entry.get('uploader')
             channel_id = entry.get('uploader_id')
             
+            success = False
             try:
                 if media_type == 'video':
-                    success, msg = self.core.download_single_video(url, quality, target_format, title, str(final_dir), hooks, channel=channel, channel_id=channel_id)
+                    success, msg = self.core.download_single_video(url, quality, target_format, title, str(final_dir), entry_hooks, channel=channel, channel_id=channel_id, force=force)
                 else:
-                    success, msg = self.core.download_single_audio(url, target_format, title, str(final_dir), hooks, channel=channel, channel_id=channel_id)
-                
-                if success:
-                    successful_count += 1
+                    success, msg = self.core.download_single_audio(url, target_format, title, str(final_dir), entry_hooks, channel=channel, channel_id=channel_id, force=force)
             except Exception:
                 pass
+            progress.finish(i)
+            return success
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(download_entry, range(1, total + 1), valid_entries))
+        successful_count = sum(1 for r in results if r)
                 
-        self.progress_update.emit(100, f"Playlist finished.")
         self.finished.emit(True, f"Playlist finished. {successful_count}/{total} successful.")
+
@@ -0,0 +1,123 @@
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtGui import QImage, QPixmap
+from core.utils import get_data_dir, make_http_session
+
+MEMORY_ENTRIES = 64       # Decoded, scaled pixmaps kept in memory
+DISK_MAX_FILES = 2000     # Oldest thumbnails are pruned beyond this
+FETCH_WORKERS = 4
+SAFE_KEY = re.compile(r'[^0-9A-Za-z_-]')
+
+
+class ThumbnailService(QObject):
+    """Loads thumbnails through a memory LRU, a disk cache keyed by video ID, and one shared HTTP session.
+
+    Downloading, decoding and scaling happen on worker threads; get() returns a
+    cached pixmap at once, otherwise `ready` is emitted later with the URL and
+    the scaled pixmap.
+    """
+    ready = Signal(str, QPixmap)
+    _loaded = Signal(str, object, QImage)
+
+    def __init__(self, cache_dir=None, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir or os.path.join(get_data_dir(), 'thumbnails')
+        self._memory = OrderedDict()   # (url, width, height) -> QPixmap
+        self._pending = set()
+        self._pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix='thumbnail')
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._pruned = False
+        self._loaded.connect(self._on_loaded)
+
+    def get(self, url, video_id=None, size=None):
+        """Return the cached pixmap for url scaled to size, or None and start loading it."""
+        if not url:
+            return None
+        width, height = (size.width(), size.height()) if size is not None else (0, 0)
+        key = (url, width, height)
+        pixmap = self._memory.get(key)
+        if pixmap is not None:
+            self._memory.move_to_end(key)
+            return pixmap
+        if key not in self._pending:
+            self._pending.add(key)
+            self._pool.submit(self._load, key, video_id)
+        return None
+
+    def _on_loaded(self, url, key, image):
+        self._pending.discard(key)
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        self._memory[key] = pixmap
+        while len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+        self.ready.emit(url, pixmap)
+
+    def _load(self, key, video_id):
+        url, width, height = key
+        image = QImage()
+        try:
+            data = self._fetch(url, video_id)
+            if data and image.loadFromData(data) and width and height:
+                image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        except Exception:
+            image = QImage()
+        self._loaded.emit(url, key, image)
+
+    def _disk_path(self, url, video_id):
+        name = SAFE_KEY.sub('_', video_id) if video_id else hashlib.sha1(url.encode('utf-8')).hexdigest()
+        ext = os.path.splitext(url.split('?', 1)[0])[1].lower()
+        return os.path.join(self.cache_dir, name + (ext if ext in ('.jpg', '.jpeg', '.png', '.webp') else '.jpg'))
+
+    def _fetch(self, url, video_id):
+        path = self._disk_path(url, video_id)
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            pass
+        response = self._get_session().get(url, timeout=10)
+        response.raise_for_status()
+        data = response.content
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._prune_disk()
+        except OSError:
+            pass
+        return data
+
+    def _get_session(self):
+        with self._session_lock:
+            if self._session is None:
+                self._session = make_http_session(FETCH_WORKERS)
+            return self._session
+
+    def _prune_disk(self):
+        if self._pruned:
+            return
+        self._pruned = True  # Once per run is enough
+        try:
+            files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)]
+            if len(files) <= DISK_MAX_FILES:
+                return
+            files.sort(key=os.path.getmtime)
+            for path in files[:len(files) - DISK_MAX_FILES]:
+                os.remove(path)
+        except OSError:
+            pass
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._session is not None:
+            self._session.close()